@@ -40,6 +40,8 @@ WEEKENDS_ONLY = CustomCalendar(
 register_calendar('WEEKENDS_ONLY', WEEKENDS_ONLY)
 set_default_calendar('WEEKENDS_ONLY')
 
+# Day count year fractions
+from ._yearfrac import year_fraction
 # Calendar utilities
 from .calendar import adjust_date
 # CDS classes
@@ -60,7 +62,7 @@ from .pricer import price_cds_simple
 # Schedule
 from .schedule import CDSSchedule, CouponPeriod, generate_cds_schedule
 # Tenor parsing
-from .tenor import Tenor, parse_tenor, tenor_to_date
+from .tenor import Tenor, parse_tenor, tenor_to_date, tenor_to_date_batch
 from .zero_curve import bootstrap_zero_curve, build_zero_curve_from_rates
 
 __all__ = [
@@ -97,6 +99,7 @@ __all__ = [
     'PaymentFrequency',
     # Calendar
     'adjust_date',
+    'year_fraction',
     # Schedule
     'CDSSchedule',
     'CouponPeriod',
@@ -110,4 +113,5 @@ __all__ = [
     'Tenor',
     'parse_tenor',
     'tenor_to_date',
+    'tenor_to_date_batch',
 ]
@@ -0,0 +1,35 @@
+"""
+Optional Numba support for numerical kernels.
+
+Numba is an optional dependency (install the ``jit`` extra). When it is
+available, ``njit`` compiles the decorated kernel to native code; otherwise
+the kernel is returned unchanged and runs as plain Python.
+"""
+
+try:
+    from numba import njit as _numba_njit
+    from numba.core.dispatcher import Dispatcher as _Dispatcher
+except ImportError:  # pragma: no cover - exercised only without numba
+    _numba_njit = None
+    _Dispatcher = None
+
+HAVE_NUMBA = _numba_njit is not None
+
+
+def njit(*args, **kwargs):
+    """
+    Drop-in replacement for ``numba.njit`` that degrades to a no-op.
+
+    Supports both the bare ``@njit`` and the ``@njit(cache=True, ...)``
+    forms.
+    """
+    if _numba_njit is not None:
+        return _numba_njit(*args, **kwargs)
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+    return lambda func: func
+
+
+def is_jitted(func) -> bool:
+    """True if func is a Numba-compiled function that njit code can call."""
+    return _Dispatcher is not None and isinstance(func, _Dispatcher)
@@ -0,0 +1,169 @@
+"""
+Direct year fraction arithmetic for the day counts used by the pricer.
+
+opendate's Interval(d1, d2).yearfrac(basis=...) builds an Interval and
+dispatches on the basis at every call. The pricer only ever needs ACT/365F,
+ACT/360 and US 30/360, so these helpers compute the same values straight
+from date ordinals.
+"""
+
+import calendar
+from collections.abc import Sequence
+from datetime import date
+
+import numpy as np
+
+from .enums import DayCountConvention
+
+
+def yearfrac_act365f(d1: date, d2: date) -> float:
+    """ACT/365 Fixed year fraction from d1 to d2."""
+    return (d2.toordinal() - d1.toordinal()) / 365.0
+
+
+def yearfrac_act360(d1: date, d2: date) -> float:
+    """ACT/360 year fraction from d1 to d2."""
+    return (d2.toordinal() - d1.toordinal()) / 360.0
+
+
+def _is_end_of_feb(d: date) -> bool:
+    return d.month == 2 and d.day == calendar.monthrange(d.year, 2)[1]
+
+
+def _thirty_360_us(d1: date, d2: date) -> float:
+    """US (NASD) 30/360 on an ascending date pair."""
+    day1, day2 = d1.day, d2.day
+    if _is_end_of_feb(d1):
+        if _is_end_of_feb(d2):
+            day2 = 30
+        day1 = 30
+    if day2 == 31 and day1 >= 30:
+        day2 = 30
+    if day1 == 31:
+        day1 = 30
+    days = (d2.year - d1.year) * 360 + (d2.month - d1.month) * 30 + (day2 - day1)
+    return days / 360
+
+
+def yearfrac_30_360(d1: date, d2: date) -> float:
+    """
+    US (NASD) 30/360 year fraction from d1 to d2.
+
+    A reversed pair returns the negated ascending value, matching
+    opendate's basis 0.
+    """
+    if d2 < d1:
+        return -_thirty_360_us(d2, d1)
+    return _thirty_360_us(d1, d2)
+
+
+def yearfrac_act365f_array(base: date, dates: Sequence[date]) -> np.ndarray:
+    """
+    ACT/365 Fixed year fractions from base to each of dates.
+
+    Args:
+        base: Start date shared by every fraction
+        dates: End dates
+
+    Returns
+        Array of year fractions, one per date
+    """
+    ordinals = np.fromiter(
+        (d.toordinal() for d in dates), dtype=np.int64, count=len(dates)
+    )
+    return (ordinals - base.toordinal()) / 365.0
+
+
+# Ordinal (date.toordinal) of the datetime64 epoch, 1970-01-01
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _ordinal_to_datetime64(ordinals) -> np.ndarray:
+    """Convert date ordinals (as from date.toordinal) to datetime64[D]."""
+    return (np.asarray(ordinals, dtype=np.int64) - _EPOCH_ORDINAL).astype(
+        'datetime64[D]'
+    )
+
+
+def _thirty_360_days_array(d1: np.ndarray, d2: np.ndarray) -> np.ndarray:
+    """US (NASD) 30/360 day counts on ascending datetime64[D] arrays."""
+    m1 = d1.astype('datetime64[M]')
+    m2 = d2.astype('datetime64[M]')
+    month1 = m1.astype(np.int64)
+    month2 = m2.astype(np.int64)
+    day1 = (d1 - m1).astype(np.int64) + 1
+    day2 = (d2 - m2).astype(np.int64) + 1
+
+    # Last day of February: tomorrow falls in a different month
+    eof1 = (month1 % 12 == 1) & ((d1 + 1).astype('datetime64[M]') != m1)
+    eof2 = (month2 % 12 == 1) & ((d2 + 1).astype('datetime64[M]') != m2)
+
+    day2 = np.where(eof1 & eof2, 30, day2)
+    day1 = np.where(eof1, 30, day1)
+    day2 = np.where((day2 == 31) & (day1 >= 30), 30, day2)
+    day1 = np.where(day1 == 31, 30, day1)
+    return (month2 - month1) * 30 + (day2 - day1)
+
+
+def _signed_thirty_360_days(start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """30/360 day counts on the ascending pair, negated when reversed."""
+    sign = np.where(end < start, -1, 1)
+    return sign * _thirty_360_days_array(np.minimum(start, end), np.maximum(start, end))
+
+
+# Denominator (days per year) of each supported day count
+_YEAR_DAYS = {
+    DayCountConvention.ACT_365F: 365.0,
+    DayCountConvention.ACT_360: 360.0,
+    DayCountConvention.THIRTY_360: 360.0,
+}
+
+
+def year_fraction(d1, d2, day_count) -> float | np.ndarray:
+    """
+    Year fractions from d1 to d2, element-wise over arrays.
+
+    Accepts single dates or arrays of dates (date objects or datetime64),
+    and a single DayCountConvention or a sequence of them; inputs broadcast
+    against each other. Values match opendate's Interval.yearfrac for
+    the same basis, including negated fractions for reversed pairs.
+
+    Args:
+        d1: Start date(s)
+        d2: End date(s)
+        day_count: Day count convention(s)
+
+    Returns
+        Year fraction, as a float for scalar inputs or an array otherwise
+    """
+    start = np.asarray(d1, dtype='datetime64[D]')
+    end = np.asarray(d2, dtype='datetime64[D]')
+
+    if isinstance(day_count, DayCountConvention):
+        # One convention: only evaluate the day count it needs
+        start, end = np.broadcast_arrays(start, end)
+        if day_count == DayCountConvention.THIRTY_360:
+            result = _signed_thirty_360_days(start, end) / _YEAR_DAYS[day_count]
+        else:
+            result = (end - start).astype(np.int64) / _YEAR_DAYS[day_count]
+    else:
+        basis = np.asarray([dc.value for dc in day_count])
+        start, end, basis = np.broadcast_arrays(start, end, basis)
+        divisor = np.where(basis == DayCountConvention.ACT_360.value, 360.0, 365.0)
+        result = np.where(
+            basis == DayCountConvention.THIRTY_360.value,
+            _signed_thirty_360_days(start, end) / 360.0,
+            (end - start).astype(np.int64) / divisor,
+        )
+
+    if result.ndim == 0:
+        return float(result)
+    return result
+
+
+# Year fraction function for each supported day count convention
+_YF = {
+    DayCountConvention.ACT_365F: yearfrac_act365f,
+    DayCountConvention.ACT_360: yearfrac_act360,
+    DayCountConvention.THIRTY_360: yearfrac_30_360,
+}
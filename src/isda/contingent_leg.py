@@ -9,19 +9,25 @@ This implements the ISDA standard methodology with Taylor expansion
 for numerical stability.
 """
 
+import math
+
 import numpy as np
 from opendate import Date
 
+from ._njit import njit
 from .curves import CreditCurve, ZeroCurve
 
+# Integration grids kept per credit curve
+_GRID_CACHE_SIZE = 32
+
 
 def contingent_leg_pv(
     value_date: Date,
     maturity_date: Date,
     discount_curve: ZeroCurve,
     credit_curve: CreditCurve,
-    recovery_rate: float = 0.4,
-    notional: float = 1.0,
+    recovery_rate: float | np.floating = 0.4,
+    notional: float | np.floating = 1.0,
     integration_points: int = 100,
     protection_start_date: Date | None = None,
     protect_start: bool = True,
@@ -56,6 +62,45 @@ def contingent_leg_pv(
     Returns
         Present value of the contingent leg (positive value)
     """
+    # Coerce once so NumPy scalar inputs (e.g. float32) neither lose
+    # precision nor leak NumPy scalar types into the result
+    loss_given_default = (1.0 - float(recovery_rate)) * float(notional)
+
+    return loss_given_default * contingent_leg_pv_per_unit_loss(
+        value_date, maturity_date,
+        discount_curve, credit_curve,
+        integration_points,
+        protection_start_date,
+    )
+
+
+def contingent_leg_pv_per_unit_loss(
+    value_date: Date,
+    maturity_date: Date,
+    discount_curve: ZeroCurve,
+    credit_curve: CreditCurve,
+    integration_points: int = 100,
+    protection_start_date: Date | None = None,
+) -> float:
+    """
+    Calculate the contingent leg PV for a unit loss given default.
+
+    The contingent leg PV is linear in (1 - R) * N, so pricing several
+    recovery rates or notionals against the same curves only needs one
+    integration: contingent_leg_pv = (1 - R) * N * this value.
+
+    Args:
+        value_date: Valuation date
+        maturity_date: CDS maturity date
+        discount_curve: Zero curve for discounting
+        credit_curve: Credit curve for survival probabilities
+        integration_points: Number of integration points
+        protection_start_date: Start of protection period. If None, uses
+                              value_date per ISDA convention.
+
+    Returns
+        Present value of the contingent leg paying 1 on default
+    """
     # ISDA logic for protection start:
     # When protectStart = TRUE (default):
     #   offset = 1
@@ -70,35 +115,82 @@ def contingent_leg_pv(
     else:
         prot_start = protection_start_date
 
-    # Calculate times for integration
-    t_start = discount_curve.time_from_date(prot_start)
-    t_end = discount_curve.time_from_date(maturity_date)
-
-    if t_end <= t_start:
+    nodes = _integration_grid(
+        prot_start, maturity_date,
+        discount_curve, credit_curve,
+        integration_points
+    )
+    if len(nodes) == 0:
         return 0.0
 
-    loss_given_default = (1.0 - recovery_rate) * notional
+    return _integrate_protection_leg(nodes, 1.0, discount_curve, credit_curve)
 
-    # Use the curve points for integration if available
-    # Otherwise use uniform grid
-    return _integrate_protection_leg(
-        t_start, t_end, loss_given_default,
-        discount_curve, credit_curve,
-        integration_points
+
+def _integration_grid(
+    prot_start: Date,
+    maturity_date: Date,
+    discount_curve: ZeroCurve,
+    credit_curve: CreditCurve,
+    num_points: int,
+) -> np.ndarray:
+    """
+    Uniform integration grid (in discount curve time) for the protection leg.
+
+    Grids are cached on the credit curve, so repeated pricings of the same
+    trade (bootstrap iterations, CS01/DV01 bumps) build each grid once. The
+    cache keeps the _GRID_CACHE_SIZE most recently used grids.
+    Returns an empty array when maturity is not after protection start.
+    """
+    key = (
+        discount_curve.base_date, discount_curve.day_count,
+        prot_start, maturity_date, num_points,
     )
+    cache = credit_curve._grid_cache
+    nodes = cache.get(key)
+    if nodes is not None:
+        cache.move_to_end(key)
+    else:
+        t_start = discount_curve.time_from_date(prot_start)
+        t_end = discount_curve.time_from_date(maturity_date)
+        if t_end <= t_start:
+            nodes = np.empty(0)
+        else:
+            dt = (t_end - t_start) / num_points
+            nodes = t_start + np.arange(num_points + 1) * dt
+        nodes.setflags(write=False)
+        cache[key] = nodes
+        if len(cache) > _GRID_CACHE_SIZE:
+            cache.popitem(last=False)
+    return nodes
 
 
 def _integrate_protection_leg(
-    t_start: float,
-    t_end: float,
+    nodes: np.ndarray,
     loss: float,
     discount_curve: ZeroCurve,
     credit_curve: CreditCurve,
-    num_points: int,
 ) -> float:
     """
     Integrate the protection leg PV using the ISDA methodology.
 
+    Survival probabilities and discount factors are evaluated once per
+    grid node; the per-sub-period accumulation runs in _contingent_leg_loop.
+    """
+    survival = credit_curve.survival_probability(nodes)
+    discount = discount_curve.discount_factor(nodes)
+
+    return float(_contingent_leg_loop(survival, discount, loss))
+
+
+@njit(cache=True, fastmath=True)
+def _contingent_leg_loop(
+    survival: np.ndarray,
+    discount: np.ndarray,
+    loss: float,
+) -> float:
+    """
+    Accumulate the protection leg PV over consecutive grid nodes.
+
     From ISDA C code (contingentleg.c:219-266):
 
     For each sub-period, calculate:
@@ -112,35 +204,28 @@ def _integrate_protection_leg(
         # Taylor expansion for numerical stability
         pv = loss * lambda_ * s0 * df0 * (1 - lambda_fwd_rate/2 + lambda_fwd_rate²/6 - ...)
     """
-    if t_end <= t_start:
-        return 0.0
-
-    dt = (t_end - t_start) / num_points
     pv = 0.0
 
-    for i in range(num_points):
-        t0 = t_start + i * dt
-        t1 = t_start + (i + 1) * dt
-
+    for i in range(len(survival) - 1):
         # Survival probabilities at start and end of sub-period
-        s0 = credit_curve.survival_probability(t0)
-        s1 = credit_curve.survival_probability(t1)
+        s0 = survival[i]
+        s1 = survival[i + 1]
 
         # Discount factors at start and end of sub-period
-        df0 = discount_curve.discount_factor(t0)
-        df1 = discount_curve.discount_factor(t1)
+        df0 = discount[i]
+        df1 = discount[i + 1]
 
         # Calculate lambda (hazard rate * dt approximation)
         # lambda_ = -ln(S(t1)/S(t0)) = ln(S(t0)) - ln(S(t1))
         if s0 > 0 and s1 > 0:
-            lambda_ = np.log(s0) - np.log(s1)
+            lambda_ = math.log(s0) - math.log(s1)
         else:
             lambda_ = 0.0
 
         # Calculate forward rate * dt
         # fwd_rate = -ln(DF(t1)/DF(t0)) = ln(DF(t0)) - ln(DF(t1))
         if df0 > 0 and df1 > 0:
-            fwd_rate = np.log(df0) - np.log(df1)
+            fwd_rate = math.log(df0) - math.log(df1)
         else:
             fwd_rate = 0.0
 
@@ -155,7 +240,7 @@ def _integrate_protection_leg(
             # PV = loss * λ / (λ+r) * (1 - e^{-(λ+r)}) * S(t0) * DF(t0)
             pv_sub = (
                 loss * lambda_ / lambda_fwd_rate
-                * (1.0 - np.exp(-lambda_fwd_rate))
+                * (1.0 - math.exp(-lambda_fwd_rate))
                 * s0 * df0
             )
         else:
@@ -180,8 +265,8 @@ def protection_leg_pv(
     maturity_date: Date,
     discount_curve: ZeroCurve,
     credit_curve: CreditCurve,
-    recovery_rate: float = 0.4,
-    notional: float = 1.0,
+    recovery_rate: float | np.floating = 0.4,
+    notional: float | np.floating = 1.0,
     integration_points: int = 100,
     protection_start_date: Date | None = None,
     protect_start: bool = True,
@@ -206,8 +291,8 @@ def expected_loss(
     value_date: Date,
     maturity_date: Date,
     credit_curve: CreditCurve,
-    recovery_rate: float = 0.4,
-    notional: float = 1.0,
+    recovery_rate: float | np.floating = 0.4,
+    notional: float | np.floating = 1.0,
 ) -> float:
     """
     Calculate the expected loss (undiscounted) over the CDS life.
@@ -226,11 +311,35 @@ def expected_loss(
     Returns
         Expected loss amount
     """
+    loss_given_default = (1.0 - float(recovery_rate)) * float(notional)
+
+    return loss_given_default * expected_loss_per_unit_loss(
+        value_date, maturity_date, credit_curve
+    )
+
+
+def expected_loss_per_unit_loss(
+    value_date: Date,
+    maturity_date: Date,
+    credit_curve: CreditCurve,
+) -> float:
+    """
+    Calculate the expected loss for a unit loss given default.
+
+    This is the default probability to maturity, 1 - Q(T);
+    expected_loss = (1 - R) * N * this value.
+
+    Args:
+        value_date: Valuation date
+        maturity_date: CDS maturity date
+        credit_curve: Credit curve
+
+    Returns
+        Default probability to maturity
+    """
     t_mat = credit_curve.time_from_date(maturity_date)
     survival = credit_curve.survival_probability(t_mat)
-    default_prob = 1.0 - survival
-
-    return (1.0 - recovery_rate) * notional * default_prob
+    return 1.0 - survival
 
 
 def default_probability_from_pv(
@@ -7,13 +7,24 @@ the ISDA standard methodology.
 
 
 import numpy as np
-from opendate import Date, Interval
+from opendate import Date
 
+from ._yearfrac import _ordinal_to_datetime64, year_fraction
 from .curves import CreditCurve, ZeroCurve
-from .enums import DayCountConvention
+from .enums import BadDayConvention, DayCountConvention
 from .exceptions import BootstrapError
 from .root_finding import brent
-from .tenor import parse_tenor
+from .tenor import tenor_to_date_batch
+
+
+def _tenor_times(
+    base_date: Date,
+    tenors: list[str],
+    day_count: DayCountConvention,
+) -> np.ndarray:
+    """Times from base_date to each (unadjusted) tenor date."""
+    ordinals = tenor_to_date_batch(tenors, base_date, BadDayConvention.NONE)
+    return year_fraction(base_date, _ordinal_to_datetime64(ordinals), day_count)
 
 
 def bootstrap_credit_curve(
@@ -48,14 +59,7 @@ def bootstrap_credit_curve(
         raise BootstrapError('par_spreads and spread_tenors must have same length')
 
     # Calculate maturity times
-    times = []
-    for tenor_str in spread_tenors:
-        tenor = parse_tenor(tenor_str)
-        mat_date = tenor.add_to_date(base_date)
-        t = Interval(base_date, mat_date).yearfrac(basis=day_count.value)
-        times.append(t)
-
-    times = np.array(times)
+    times = _tenor_times(base_date, spread_tenors, day_count)
 
     # Initialize credit curve
     credit_curve = CreditCurve(
@@ -226,11 +230,5 @@ def credit_curve_from_hazard_rates(
     Returns
         CreditCurve
     """
-    times = []
-    for tenor_str in tenors:
-        tenor = parse_tenor(tenor_str)
-        mat_date = tenor.add_to_date(base_date)
-        t = Interval(base_date, mat_date).yearfrac(basis=day_count.value)
-        times.append(t)
-
-    return CreditCurve(base_date, np.array(times), np.array(hazard_rates), day_count)
+    times = _tenor_times(base_date, tenors, day_count)
+    return CreditCurve(base_date, times, np.array(hazard_rates), day_count)
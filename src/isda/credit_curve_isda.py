@@ -10,8 +10,9 @@ iteration, ensuring perfect alignment with the C library results.
 """
 
 import numpy as np
-from opendate import Date, Interval
+from opendate import Date
 
+from ._yearfrac import yearfrac_act365f, yearfrac_act365f_array
 from .contingent_leg import contingent_leg_pv
 from .curves import CreditCurve, ZeroCurve
 from .enums import AccrualOnDefault, BadDayConvention, DayCountConvention
@@ -70,9 +71,7 @@ def bootstrap_credit_curve_isda(
         accrual_start = accrual_start_date
 
     # Calculate maturity time
-    t_mat = Interval(base_date, maturity_date).yearfrac(
-        basis=DayCountConvention.ACT_365F.value
-    )
+    t_mat = yearfrac_act365f(base_date, maturity_date)
 
     # Generate the CDS schedule
     schedule = generate_cds_schedule(
@@ -206,10 +205,7 @@ def bootstrap_credit_curve_flat(
     hazard_rate = single_point_curve._values[0]
 
     # Create multi-point curve with same hazard rate at all maturities
-    times = np.array([
-        Interval(base_date, d).yearfrac(basis=DayCountConvention.ACT_365F.value)
-        for d in maturity_dates
-    ])
+    times = yearfrac_act365f_array(base_date, maturity_dates)
     times.sort()
 
     return CreditCurve(
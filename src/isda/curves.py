@@ -7,12 +7,15 @@ Provides base curve functionality for:
 """
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 
 import numpy as np
-from opendate import Date, Interval
+from opendate import Date
 
+from ._yearfrac import _YF
 from .enums import DayCountConvention
-from .interpolation import flat_forward_interp
+from .exceptions import CurveError
+from .interpolation import _flat_forward_interp_array, _flat_forward_interp_scalar
 
 
 class Curve(ABC):
@@ -55,9 +58,28 @@ class Curve(ABC):
         """Array of curve values (rates or hazard rates)."""
         return self._values
 
+    def _set_knots(self, times, values) -> None:
+        """
+        Take the curve knots as contiguous float64 arrays, validated once.
+
+        The interpolation kernels are then called on these arrays directly,
+        without per-call conversion or checks.
+
+        Raises
+            CurveError: If times and values differ in shape or times decrease
+        """
+        times = np.ascontiguousarray(times, dtype=np.float64)
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        if times.ndim != 1 or times.shape != values.shape:
+            raise CurveError('Curve times and values must be equal-length 1-d arrays')
+        if np.any(np.diff(times) < 0):
+            raise CurveError('Curve times must be sorted in increasing order')
+        self._times = times
+        self._values = values
+
     def time_from_date(self, d: Date) -> float:
         """Convert a date to time (years from base date)."""
-        return Interval(self._base_date, d).yearfrac(basis=self._day_count.value)
+        return _YF[self._day_count](self._base_date, d)
 
     def date_to_time(self, d: Date) -> float:
         """Alias for time_from_date."""
@@ -67,6 +89,22 @@ class Curve(ABC):
     def value_at(self, t: float) -> float:
         """Get the curve value at time t."""
 
+    def values_at(self, t: np.ndarray) -> np.ndarray:
+        """Get the curve values at each time in the array t."""
+        t = np.asarray(t, dtype=float)
+        if len(self._times) == 0:
+            return np.zeros_like(t)
+        return _flat_forward_interp_array(t, self._times, self._values)
+
+    def _exp_decay(self, t: float | np.ndarray) -> float | np.ndarray:
+        """exp(-value(t) * t), equal to 1 for t <= 0; scalar or array t."""
+        if np.ndim(t) == 0:
+            if t <= 0:
+                return 1.0
+            return np.exp(-self.value_at(t) * t)
+        t = np.asarray(t, dtype=float)
+        return np.where(t <= 0, 1.0, np.exp(-self.values_at(t) * t))
+
 
 class ZeroCurve(Curve):
     """
@@ -95,8 +133,7 @@ class ZeroCurve(Curve):
         super().__init__(base_date, day_count)
 
         if times is not None and rates is not None:
-            self._times = np.asarray(times, dtype=float)
-            self._values = np.asarray(rates, dtype=float)
+            self._set_knots(times, rates)
         elif times is not None or rates is not None:
             raise ValueError('Both times and rates must be provided, or neither')
 
@@ -109,7 +146,7 @@ class ZeroCurve(Curve):
         """Get the zero rate at time t."""
         if len(self._times) == 0:
             return 0.0
-        return flat_forward_interp(t, self._times, self._values)
+        return _flat_forward_interp_scalar(float(t), self._times, self._values)
 
     def rate(self, t: float) -> float:
         """Get the zero rate at time t."""
@@ -120,16 +157,16 @@ class ZeroCurve(Curve):
         t = self.time_from_date(d)
         return self.rate(t)
 
-    def discount_factor(self, t: float) -> float:
+    def discount_factor(self, t: float | np.ndarray) -> float | np.ndarray:
         """
         Calculate the discount factor at time t.
 
         DF(t) = exp(-r(t) * t)
+
+        t may be an array, in which case an array of discount factors is
+        returned.
         """
-        if t <= 0:
-            return 1.0
-        r = self.rate(t)
-        return np.exp(-r * t)
+        return self._exp_decay(t)
 
     def discount_factor_at_date(self, d: Date) -> float:
         """Calculate the discount factor at a specific date."""
@@ -202,11 +239,16 @@ class CreditCurve(Curve):
         super().__init__(base_date, day_count)
 
         if times is not None and hazard_rates is not None:
-            self._times = np.asarray(times, dtype=float)
-            self._values = np.asarray(hazard_rates, dtype=float)
+            self._set_knots(times, hazard_rates)
         elif times is not None or hazard_rates is not None:
             raise ValueError('Both times and hazard_rates must be provided, or neither')
 
+        # Protection leg integration grids, keyed by discount curve basis,
+        # protection start, maturity and point count. The grid does not
+        # depend on the hazard rates, so it survives bootstrapping and bumps.
+        # Least recently used order, capped by the contingent leg.
+        self._grid_cache: OrderedDict[tuple, np.ndarray] = OrderedDict()
+
     @property
     def hazard_rates(self) -> np.ndarray:
         """Array of average hazard rates."""
@@ -216,7 +258,7 @@ class CreditCurve(Curve):
         """Get the average hazard rate at time t."""
         if len(self._times) == 0:
             return 0.0
-        return flat_forward_interp(t, self._times, self._values)
+        return _flat_forward_interp_scalar(float(t), self._times, self._values)
 
     def hazard_rate(self, t: float) -> float:
         """Get the average hazard rate at time t."""
@@ -227,16 +269,16 @@ class CreditCurve(Curve):
         t = self.time_from_date(d)
         return self.hazard_rate(t)
 
-    def survival_probability(self, t: float) -> float:
+    def survival_probability(self, t: float | np.ndarray) -> float | np.ndarray:
         """
         Calculate the survival probability at time t.
 
         Q(t) = exp(-h(t) * t)
+
+        t may be an array, in which case an array of survival probabilities
+        is returned.
         """
-        if t <= 0:
-            return 1.0
-        h = self.hazard_rate(t)
-        return np.exp(-h * t)
+        return self._exp_decay(t)
 
     def survival_probability_at_date(self, d: Date) -> float:
         """Calculate the survival probability at a specific date."""
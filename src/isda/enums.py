@@ -4,7 +4,7 @@ Enumeration types for the ISDA CDS pricer.
 These enums define the standard conventions used in CDS pricing.
 """
 
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
 
 
 class DayCountConvention(Enum):
@@ -136,8 +136,13 @@ class AccrualOnDefault(Enum):
         raise ValueError(f'Unknown accrual on default setting: {s}')
 
 
-class PaymentFrequency(Enum):
-    """Payment frequency for CDS fee leg."""
+class PaymentFrequency(IntEnum):
+    """
+    Payment frequency for CDS fee leg.
+
+    The value is the number of months between payments, so int(frequency)
+    gives the schedule step directly.
+    """
 
     QUARTERLY = 3    # Standard CDS payment frequency
     SEMI_ANNUAL = 6
@@ -147,7 +152,7 @@ class PaymentFrequency(Enum):
     @property
     def months(self) -> int:
         """Return the number of months between payments."""
-        return self.value
+        return int(self)
 
     @classmethod
     def from_string(cls, s: str) -> 'PaymentFrequency':
@@ -13,6 +13,7 @@ This implements the ISDA standard methodology.
 import numpy as np
 from opendate import Date, Interval
 
+from ._yearfrac import _YF, year_fraction
 from .curves import CreditCurve, ZeroCurve
 from .enums import AccrualOnDefault, DayCountConvention
 from .schedule import CDSSchedule
@@ -94,9 +95,7 @@ def fee_leg_pv(
         if is_last_period and protect_start:
             # Last period: accEndDate = endDate + 1, so recalculate year fraction
             extended_end = period.accrual_end.add(days=1)
-            yf = Interval(period.accrual_start, extended_end).yearfrac(
-                basis=schedule.day_count.value
-            )
+            yf = _YF[schedule.day_count](period.accrual_start, extended_end)
         else:
             yf = period.year_fraction
 
@@ -169,7 +168,7 @@ def _calculate_accrual_on_default(
         return 0.0
 
     # Total accrual time for the period (used to calculate accrual rate)
-    total_yf = Interval(acc_start, acc_end).yearfrac(basis=day_count.value)
+    total_yf = _YF[day_count](acc_start, acc_end)
     total_amount = notional * coupon_rate * total_yf
 
     # Accrual rate per year (amount / time in years)
@@ -283,12 +282,12 @@ def risky_annuity(
 
 
 def calculate_accrued_interest(
-    value_date: Date,
+    value_date: Date | np.ndarray,
     schedule: CDSSchedule,
     coupon_rate: float,
     notional: float = 1.0,
-    stepin_date: Date | None = None,
-) -> float:
+    stepin_date: Date | np.ndarray | None = None,
+) -> float | np.ndarray:
     """
     Calculate accrued interest at the stepin date.
 
@@ -296,45 +295,39 @@ def calculate_accrued_interest(
     not value_date. This is because the stepin date is when the protection buyer
     actually steps into the trade.
 
+    value_date (or stepin_date) may be an array of dates, in which case the
+    accrual period of every date is found with one searchsorted over the
+    schedule's period end dates.
+
     Args:
-        value_date: Valuation date (today)
+        value_date: Valuation date(s) (today)
         schedule: CDS payment schedule
         coupon_rate: Annual coupon rate
         notional: Notional amount
-        stepin_date: Date for accrued calculation (default: value_date + 1)
+        stepin_date: Date(s) for accrued calculation (default: value_date + 1)
 
     Returns
-        Accrued interest (always positive for accrued premium)
+        Accrued interest (always positive for accrued premium), as a float for
+        a single date or an array otherwise
     """
     # ISDA convention: accrued is calculated to stepinDate, not today
     if stepin_date is None:
-        ai_date = value_date.add(days=1)
+        value_dates = np.asarray(value_date, dtype='datetime64[D]')
+        ai_dates = value_dates + np.timedelta64(1, 'D')
     else:
-        ai_date = stepin_date
-
-    for period in schedule.periods:
-        if period.accrual_start <= ai_date <= period.accrual_end:
-            yf = Interval(period.accrual_start, ai_date).yearfrac(
-                basis=schedule.day_count.value
-            )
-            return notional * coupon_rate * yf
-        # Also handle case where ai_date falls in extended last period
-        if period == schedule.periods[-1] and period.accrual_start < ai_date:
-            yf = Interval(period.accrual_start, ai_date).yearfrac(
-                basis=schedule.day_count.value
-            )
-            return notional * coupon_rate * yf
-
-    # Check if before first period
-    if ai_date < schedule.periods[0].accrual_start:
-        return 0.0
-
-    # If after all periods, use last period
-    last = schedule.periods[-1]
-    if ai_date > last.accrual_end:
-        yf = Interval(last.accrual_start, last.accrual_end).yearfrac(
-            basis=schedule.day_count.value
-        )
-        return notional * coupon_rate * yf
-
-    return 0.0
+        ai_dates = np.asarray(stepin_date, dtype='datetime64[D]')
+
+    starts = schedule.period_starts
+    ends = schedule.period_ends
+
+    # First period whose end is on or after ai_date; dates past the last
+    # end accrue from the start of the (extended) last period
+    idx = np.minimum(np.searchsorted(ends, ai_dates, side='left'), len(ends) - 1)
+    accrual_start = starts[idx]
+
+    yf = year_fraction(accrual_start, ai_dates, schedule.day_count)
+    # Nothing has accrued before the first period starts
+    accrued = np.where(ai_dates < accrual_start, 0.0, notional * coupon_rate * yf)
+    if accrued.ndim == 0:
+        return float(accrued)
+    return accrued
@@ -6,6 +6,7 @@ IMM dates are the standard maturity dates for CDS contracts:
 - Semi-annual roll convention implemented post-2015
 """
 
+import numpy as np
 from opendate import Date, Interval
 
 # Standard IMM months
@@ -157,22 +158,32 @@ def imm_dates_for_tenors(
         >>> imm_dates_for_tenors(Date(2018, 1, 8), [0.5, 1, 2, 3, 5, 7])
         [('6M', '20/06/2018'), ('1Y', '20/12/2018'), ...]
     """
-    results = []
-
-    for tenor_years in tenor_list:
-        # Convert tenor to months
-        if tenor_years < 1:
-            months = int(tenor_years * 12)
-            label = f'{months}M'
-        else:
-            months = int(tenor_years * 12)
-            label = f'{int(tenor_years)}Y'
-
-        imm = imm_date_for_tenor(reference_date, months, apply_semi_annual_roll)
-
-        if date_format:
-            results.append((label, imm.strftime(date_format)))
-        else:
-            results.append((label, imm))
-
-    return results
+    tenors = np.asarray(tenor_list, dtype=float)
+    months = (tenors * 12).astype(np.int64)
+    labels = [
+        f'{m}M' if t < 1 else f'{int(t)}Y' for t, m in zip(tenor_list, months.tolist())
+    ]
+
+    # Target month of each tenor, counted in months since year 0
+    target = reference_date.year * 12 + (reference_date.month - 1) + months
+    month = target % 12 + 1
+
+    # Next IMM month strictly after the target date. Adding months keeps the
+    # day of month (clamped to month end), so the target falls before the
+    # IMM day exactly when the reference date does.
+    past_imm_day = reference_date.day >= IMM_DAY
+    imm = target - (month - 1) + ((month + 2) // 3) * 3 - 1
+    imm = imm + 3 * ((month % 3 == 0) & past_imm_day)
+
+    if apply_semi_annual_roll:
+        start = SEMI_ANNUAL_ROLL_START
+        roll_start = start.year * 12 + (start.month - 1)
+        imm_month = imm % 12 + 1
+        roll = (imm >= roll_start) & np.isin(imm_month, SEMI_ANNUAL_ROLL_MONTHS)
+        imm = imm + 3 * roll
+
+    dates = [Date(m // 12, m % 12 + 1, IMM_DAY) for m in imm.tolist()]
+
+    if date_format:
+        return [(label, d.strftime(date_format)) for label, d in zip(labels, dates)]
+    return list(zip(labels, dates))
@@ -8,9 +8,218 @@ for ISDA CDS pricing.
 
 import numpy as np
 
+from ._njit import njit
 from .exceptions import InterpolationError
 
 
+def _as_knots(times, rates) -> tuple[np.ndarray, np.ndarray]:
+    """Validate curve knots and return them as contiguous float64 arrays."""
+    if len(times) == 0 or len(rates) == 0:
+        raise InterpolationError('Empty curve data')
+
+    if len(times) != len(rates):
+        raise InterpolationError('Times and rates arrays must have same length')
+
+    return (
+        np.ascontiguousarray(times, dtype=np.float64),
+        np.ascontiguousarray(rates, dtype=np.float64),
+    )
+
+
+@njit(cache=True)
+def _flat_forward_segment(
+    target_time: float,
+    pos: int,
+    times: np.ndarray,
+    rates: np.ndarray,
+) -> float:
+    """
+    Flat forward rate at an interior target time.
+
+    pos is the index of the first knot >= target_time, as returned by a
+    left-side searchsorted.
+    """
+    idx = max(0, min(pos - 1, len(times) - 2))
+
+    t0, t1 = times[idx], times[idx + 1]
+    r0, r1 = rates[idx], rates[idx + 1]
+
+    # Flat forward interpolation formula:
+    # r(t) * t = r0 * t0 + f * (t - t0)
+    # where f is the forward rate that makes r1 * t1 = r0 * t0 + f * (t1 - t0)
+    # so f = (r1 * t1 - r0 * t0) / (t1 - t0)
+
+    dt = t1 - t0
+    if abs(dt) < 1e-14:
+        return r0
+
+    # Forward rate in this segment
+    fwd_rate = (r1 * t1 - r0 * t0) / dt
+
+    # Interpolated rate
+    return (r0 * t0 + fwd_rate * (target_time - t0)) / target_time
+
+
+@njit(cache=True)
+def _flat_forward_interp_scalar(
+    target_time: float,
+    times: np.ndarray,
+    rates: np.ndarray,
+) -> float:
+    """Flat forward interpolation kernel on validated, contiguous knots."""
+    n = len(times)
+
+    # Handle extrapolation before first point
+    if target_time <= times[0]:
+        return rates[0]
+
+    # Handle extrapolation after last point
+    if target_time >= times[n - 1]:
+        return rates[n - 1]
+
+    # Binary search for the first knot >= target_time (searchsorted, left).
+    # Unrolling it into a per-curve-size if-tree does not pay: compiled,
+    # the call overhead dominates for curves of up to 32 knots
+    lo = 0
+    hi = n
+    while lo < hi:
+        mid = (lo + hi) >> 1
+        if times[mid] < target_time:
+            lo = mid + 1
+        else:
+            hi = mid
+
+    return _flat_forward_segment(target_time, lo, times, rates)
+
+
+@njit(cache=True)
+def _bsearch_with_guess(times: np.ndarray, t: float, guess: int) -> int:
+    """
+    Index of the first knot >= t (searchsorted, left), starting from guess.
+
+    The window around guess is widened by doubling steps until it brackets
+    t, then bisected, so a guess at or next to the answer resolves in a
+    couple of comparisons. Short curves are scanned linearly.
+    """
+    n = len(times)
+    if n < 16:
+        i = 0
+        while i < n and times[i] < t:
+            i += 1
+        return i
+
+    guess = max(0, min(guess, n))
+    step = 1
+    if guess < n and times[guess] < t:
+        # Answer lies above guess: gallop upwards
+        lo = guess + 1
+        probe = lo
+        while probe < n and times[probe] < t:
+            lo = probe + 1
+            probe += step
+            step *= 2
+        hi = min(probe, n)
+    else:
+        # Answer is at or below guess: gallop downwards
+        hi = guess
+        probe = guess - 1
+        while probe >= 0 and times[probe] >= t:
+            hi = probe
+            probe -= step
+            step *= 2
+        lo = max(probe + 1, 0)
+
+    while lo < hi:
+        mid = (lo + hi) >> 1
+        if times[mid] < t:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+@njit(cache=True)
+def _flat_forward_interp_monotone(
+    target_times: np.ndarray,
+    times: np.ndarray,
+    rates: np.ndarray,
+) -> np.ndarray:
+    """Flat forward interpolation threading the search position between points."""
+    n = len(times)
+    result = np.empty(len(target_times))
+    guess = 0
+    for i in range(len(target_times)):
+        t = target_times[i]
+        if t <= times[0]:
+            result[i] = rates[0]
+        elif t >= times[n - 1]:
+            result[i] = rates[n - 1]
+        else:
+            guess = _bsearch_with_guess(times, t, guess)
+            result[i] = _flat_forward_segment(t, guess, times, rates)
+    return result
+
+
+@njit(cache=True)
+def _flat_forward_exp_decay(
+    target_time: float,
+    times: np.ndarray,
+    rates: np.ndarray,
+) -> float:
+    """exp(-r(t) * t) under flat forward interpolation, 1 for t <= 0."""
+    if target_time <= 0:
+        return 1.0
+    rate = _flat_forward_interp_scalar(target_time, times, rates)
+    return np.exp(-rate * target_time)
+
+
+@njit(cache=True)
+def _linear_interp(
+    target_times: np.ndarray,
+    times: np.ndarray,
+    values: np.ndarray,
+) -> np.ndarray:
+    """Linear interpolation kernel on validated knots, callable from jitted code."""
+    return np.interp(target_times, times, values)
+
+
+def _flat_forward_interp_array(
+    target_times: np.ndarray,
+    times: np.ndarray,
+    rates: np.ndarray,
+) -> np.ndarray:
+    """
+    Flat forward interpolation at every target time in one vector pass.
+
+    Segments are located with a single searchsorted (left side, as in the
+    scalar kernel) and the same formula is evaluated on the r * t products,
+    so each point matches _flat_forward_interp_scalar exactly.
+    """
+    n = len(times)
+    if n == 1:
+        return np.full(target_times.shape, rates[0])
+
+    idx = np.searchsorted(times, target_times, side='left') - 1
+    np.clip(idx, 0, n - 2, out=idx)
+
+    # Forward rate of each segment, gathered per point; masked points
+    # (extrapolation, degenerate segments) may divide by zero
+    cum = times * rates
+    dt = np.diff(times)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fwd_rate = np.diff(cum) / dt
+        rate = cum[idx] + fwd_rate[idx] * (target_times - times[idx])
+        rate /= target_times
+
+    degenerate = np.abs(dt) < 1e-14
+    if degenerate.any():
+        np.copyto(rate, rates[idx], where=degenerate[idx])
+    # Flat extrapolation outside the knots
+    np.copyto(rate, rates[-1], where=target_times >= times[-1])
+    np.copyto(rate, rates[0], where=target_times <= times[0])
+    return rate
+
+
 def flat_forward_interp(
     target_time: float,
     times: np.ndarray,
@@ -37,76 +246,92 @@ def flat_forward_interp(
     Returns
         Interpolated zero rate at target_time
     """
-    if len(times) == 0 or len(rates) == 0:
-        raise InterpolationError('Empty curve data')
+    times, rates = _as_knots(times, rates)
+    return _flat_forward_interp_scalar(float(target_time), times, rates)
 
-    if len(times) != len(rates):
-        raise InterpolationError('Times and rates arrays must have same length')
 
-    n = len(times)
+# exp(-k / 512) for k = 0..1024, covering exponents in [-2, 0]
+_EXP_LUT_SCALE = 512.0
+_EXP_LUT = np.exp(-np.arange(1025) / _EXP_LUT_SCALE)
 
-    # Handle extrapolation before first point
-    if target_time <= times[0]:
-        return rates[0]
 
-    # Handle extrapolation after last point
-    if target_time >= times[-1]:
-        return rates[-1]
-
-    # Find the segment containing target_time
-    # Binary search for efficiency
-    idx = np.searchsorted(times, target_time) - 1
-    idx = max(0, min(idx, n - 2))
-
-    t0, t1 = times[idx], times[idx + 1]
-    r0, r1 = rates[idx], rates[idx + 1]
+@njit(cache=True)
+def _fast_exp_neg_kernel(x, lut, out):
+    for j in range(x.size):
+        pos = -x[j] * _EXP_LUT_SCALE
+        if pos >= 0.0 and pos < lut.size - 1:
+            i = int(pos)
+            frac = pos - i
+            out[j] = lut[i] * (1.0 - frac) + lut[i + 1] * frac
+        else:
+            out[j] = np.exp(x[j])
+    return out
 
-    # Flat forward interpolation formula:
-    # r(t) * t = r0 * t0 + f * (t - t0)
-    # where f is the forward rate that makes r1 * t1 = r0 * t0 + f * (t1 - t0)
-    # so f = (r1 * t1 - r0 * t0) / (t1 - t0)
 
-    dt = t1 - t0
-    if abs(dt) < 1e-14:
-        return r0
+def _fast_exp_neg(x: float | np.ndarray) -> np.ndarray:
+    """
+    Approximate exp(x) by linear interpolation in _EXP_LUT.
 
-    # Forward rate in this segment
-    fwd_rate = (r1 * t1 - r0 * t0) / dt
+    Exponents in [-2, 0] (discount factors and survival probabilities down
+    to about 0.135) are within 1e-6 relative error; others use np.exp.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    flat = np.ascontiguousarray(x).ravel()
+    out = np.empty_like(flat)
+    return _fast_exp_neg_kernel(flat, _EXP_LUT, out).reshape(x.shape)
 
-    # Interpolated rate
-    rate = (r0 * t0 + fwd_rate * (target_time - t0)) / target_time
 
-    return rate
+def _flat_forward_decay(
+    target_time: float | np.ndarray,
+    times: np.ndarray,
+    rates: np.ndarray,
+    fast: bool,
+) -> float | np.ndarray:
+    """exp(-r(t) * t) for a scalar or array t, equal to 1 for t <= 0."""
+    if np.ndim(target_time) == 0:
+        if target_time <= 0:
+            return 1.0
+        times, rates = _as_knots(times, rates)
+        if not fast:
+            return _flat_forward_exp_decay(float(target_time), times, rates)
+        rate = _flat_forward_interp_scalar(float(target_time), times, rates)
+        return float(_fast_exp_neg(-rate * target_time))
+
+    t = np.asarray(target_time, dtype=np.float64)
+    times, rates = _as_knots(times, rates)
+    exponent = -_flat_forward_interp_array(t, times, rates) * t
+    decay = _fast_exp_neg(exponent) if fast else np.exp(exponent)
+    return np.where(t <= 0, 1.0, decay)
 
 
 def flat_forward_discount_factor(
-    target_time: float,
+    target_time: float | np.ndarray,
     times: np.ndarray,
     rates: np.ndarray,
-) -> float:
+    fast: bool = False,
+) -> float | np.ndarray:
     """
     Calculate discount factor using flat forward interpolation.
 
     Args:
-        target_time: Time point (in years)
+        target_time: Time point (in years), or an array of them
         times: Array of curve times
         rates: Array of zero rates
+        fast: Approximate exp with a lookup table (within 1e-6 relative
+            error), for bulk scenario revaluation
 
     Returns
-        Discount factor at target_time
+        Discount factor at target_time (an array for array input)
     """
-    if target_time <= 0:
-        return 1.0
-
-    rate = flat_forward_interp(target_time, times, rates)
-    return np.exp(-rate * target_time)
+    return _flat_forward_decay(target_time, times, rates, fast)
 
 
 def flat_forward_survival_probability(
-    target_time: float,
+    target_time: float | np.ndarray,
     times: np.ndarray,
     hazard_rates: np.ndarray,
-) -> float:
+    fast: bool = False,
+) -> float | np.ndarray:
     """
     Calculate survival probability using flat forward interpolation.
 
@@ -114,18 +339,16 @@ def flat_forward_survival_probability(
     average hazard rate to time t.
 
     Args:
-        target_time: Time point (in years)
+        target_time: Time point (in years), or an array of them
         times: Array of curve times
         hazard_rates: Array of average hazard rates
+        fast: Approximate exp with a lookup table (within 1e-6 relative
+            error), for bulk scenario revaluation
 
     Returns
-        Survival probability at target_time
+        Survival probability at target_time (an array for array input)
     """
-    if target_time <= 0:
-        return 1.0
-
-    rate = flat_forward_interp(target_time, times, hazard_rates)
-    return np.exp(-rate * target_time)
+    return _flat_forward_decay(target_time, times, hazard_rates, fast)
 
 
 def interpolate_curve(
@@ -137,6 +360,9 @@ def interpolate_curve(
     """
     Interpolate multiple points on a curve.
 
+    Linear interpolation is np.interp, with flat extrapolation, run by the
+    _linear_interp kernel that jitted code can also call directly.
+
     Args:
         target_times: Array of times to interpolate
         times: Array of curve times
@@ -145,16 +371,48 @@ def interpolate_curve(
 
     Returns
         Array of interpolated values
+
+    Raises
+        InterpolationError: If the knots are empty or mismatched, or the
+            method is unknown
     """
-    if method == 'flat_forward':
-        return np.array([
-            flat_forward_interp(t, times, values) for t in target_times
-        ])
-    elif method == 'linear':
-        return np.interp(target_times, times, values)
-    else:
+    if method not in {'flat_forward', 'linear'}:
         raise InterpolationError(f'Unknown interpolation method: {method}')
 
+    times, values = _as_knots(times, values)
+    target_times = np.asarray(target_times, dtype=np.float64)
+    if method == 'linear':
+        return _linear_interp(target_times, times, values)
+    return _flat_forward_interp_array(target_times, times, values)
+
+
+def interpolate_curve_monotone(
+    target_times: np.ndarray,
+    times: np.ndarray,
+    values: np.ndarray,
+) -> np.ndarray:
+    """
+    Flat forward interpolation for (mostly) increasing target times.
+
+    Each point's segment search starts from the previous point's segment,
+    which is faster than a fresh binary search when the targets are sorted,
+    as schedule and integration dates are. Unsorted targets still give the
+    same result as interpolate_curve.
+
+    Args:
+        target_times: Array of times to interpolate, ideally increasing
+        times: Array of curve times
+        values: Array of curve values (rates)
+
+    Returns
+        Array of interpolated values
+    """
+    times, values = _as_knots(times, values)
+    target_times = np.ascontiguousarray(target_times, dtype=np.float64)
+    return _flat_forward_interp_monotone(target_times.ravel(), times, values).reshape(
+        target_times.shape
+    )
+
 
 def forward_rate(
     t1: float,
@@ -4,6 +4,7 @@ High-level CDS Pricer API.
 Provides a clean, user-friendly interface for pricing CDS contracts.
 """
 
+import dataclasses
 import datetime
 import functools
 import inspect
@@ -14,7 +15,7 @@ from opendate import Date
 from .cds import CDS, CDSContract, CDSPricingResult
 from .credit_curve import bootstrap_credit_curve
 from .credit_curve_isda import bootstrap_credit_curve_isda
-from .curves import CreditCurve
+from .curves import CreditCurve, ZeroCurve
 from .enums import DayCountConvention, PaymentFrequency
 from .root_finding import brent
 from .zero_curve import bootstrap_zero_curve
@@ -101,17 +102,52 @@ class CDSPricer:
             fixed_day_count: Day count for swap fixed leg (default 30/360 per ISDA)
             mm_day_count: Day count for money market rates (default ACT/360 per ISDA)
         """
-        self.trade_date = ensure_date(trade_date)
+        trade_date = ensure_date(trade_date)
 
         # Bootstrap the zero curve using ISDA conventions
-        self.zero_curve = bootstrap_zero_curve(
-            base_date=self.trade_date,
+        zero_curve = bootstrap_zero_curve(
+            base_date=trade_date,
             swap_rates=swap_rates,
             swap_tenors=swap_tenors,
             swap_maturity_dates=swap_maturity_dates,
             fixed_day_count=fixed_day_count,
             mm_day_count=mm_day_count,
         )
+        self._init_market_data(trade_date, zero_curve)
+
+    def _init_market_data(self, trade_date: Date, zero_curve: ZeroCurve) -> None:
+        """Set up pricer state; shared by __init__ and from_zero_curve."""
+        self.trade_date = trade_date
+        self.zero_curve = zero_curve
+
+    @classmethod
+    def from_zero_curve(cls, trade_date: DateLike, zero_curve: ZeroCurve) -> 'CDSPricer':
+        """
+        Create a pricer around an already bootstrapped zero curve.
+
+        Lets several pricers (or repeated test setups) share one zero curve
+        bootstrap instead of rebuilding it from swap rates.
+
+        Args:
+            trade_date: Trade/valuation date
+            zero_curve: Zero curve whose base date is the trade date
+
+        Returns
+            CDSPricer using zero_curve for discounting
+
+        Raises
+            ValueError: If the zero curve base date is not the trade date
+        """
+        trade_date = ensure_date(trade_date)
+        if zero_curve.base_date != trade_date:
+            raise ValueError(
+                f'Zero curve base date {zero_curve.base_date} does not match '
+                f'trade date {trade_date}'
+            )
+
+        pricer = cls.__new__(cls)
+        pricer._init_market_data(trade_date, zero_curve)
+        return pricer
 
     def build_credit_curve(
         self,
@@ -175,6 +211,135 @@ class CDSPricer:
             from .imm import previous_imm_date
             accrual_start_date = previous_imm_date(self.trade_date)
 
+        return self._price_cds(
+            maturity_date=maturity_date,
+            par_spread=par_spread,
+            coupon_rate=coupon_rate,
+            notional=notional,
+            recovery_rate=recovery_rate,
+            is_buy_protection=is_buy_protection,
+            accrual_start_date=accrual_start_date,
+            value_date=value_date,
+        )
+
+    @ensure_dates('maturity_date', 'accrual_start_date', 'value_date')
+    def price_cds_batch(
+        self,
+        maturity_date: DateLike,
+        par_spreads: list[float],
+        coupon_rate: float,  # In basis points
+        notional: float,
+        recovery_rates: list[float],
+        is_buy_protection: bool = True,
+        accrual_start_date: DateLike | None = None,
+        value_date: DateLike | None = None,
+    ) -> list[CDSPricingResult]:
+        """
+        Price several single-name CDS that share contract terms.
+
+        Typical use is pricing the constituents of a CDS index: every name
+        is priced off this pricer's zero curve, and the dates and defaults
+        are resolved once for the whole batch. Each name still gets its own
+        credit curve.
+
+        Args:
+            maturity_date: CDS maturity date
+            par_spreads: Par CDS spread for each name (as decimals)
+            coupon_rate: Coupon rate in basis points
+            notional: Notional amount per name
+            recovery_rates: Recovery rate for each name
+            is_buy_protection: True for buying protection, False for selling
+            accrual_start_date: Start of first accrual period (default: previous IMM)
+            value_date: Valuation date (default: trade date)
+
+        Returns
+            List of CDSPricingResult, one per name
+        """
+        if len(par_spreads) != len(recovery_rates):
+            raise ValueError('par_spreads and recovery_rates must have same length')
+
+        if value_date is None:
+            value_date = self.trade_date
+        if accrual_start_date is None:
+            from .imm import previous_imm_date
+            accrual_start_date = previous_imm_date(self.trade_date)
+
+        return [
+            self._price_cds(
+                maturity_date=maturity_date,
+                par_spread=par_spread,
+                coupon_rate=coupon_rate,
+                notional=notional,
+                recovery_rate=recovery_rate,
+                is_buy_protection=is_buy_protection,
+                accrual_start_date=accrual_start_date,
+                value_date=value_date,
+            )
+            for par_spread, recovery_rate in zip(par_spreads, recovery_rates)
+        ]
+
+    @ensure_dates('maturity_date', 'accrual_start_date', 'value_date')
+    def price_cds_both_sides(
+        self,
+        maturity_date: DateLike,
+        par_spread: float,
+        coupon_rate: float,  # In basis points
+        notional: float,
+        recovery_rate: float,
+        accrual_start_date: DateLike | None = None,
+        value_date: DateLike | None = None,
+    ) -> tuple[CDSPricingResult, CDSPricingResult]:
+        """
+        Price a CDS from both the protection buyer's and seller's side.
+
+        The credit curve is bootstrapped and the CDS priced once as the
+        protection buyer; the seller's result is the same trade with the
+        signed metrics negated.
+
+        Args:
+            maturity_date: CDS maturity date
+            par_spread: Par CDS spread (as decimal, e.g., 0.01 for 100bps)
+            coupon_rate: Coupon rate in basis points (e.g., 100 for 100bps)
+            notional: Notional amount
+            recovery_rate: Recovery rate assumption
+            accrual_start_date: Start of first accrual period (default: previous IMM)
+            value_date: Valuation date (default: trade date)
+
+        Returns
+            Tuple of (buy protection result, sell protection result)
+        """
+        buy = self.price_cds(
+            maturity_date=maturity_date,
+            par_spread=par_spread,
+            coupon_rate=coupon_rate,
+            notional=notional,
+            recovery_rate=recovery_rate,
+            is_buy_protection=True,
+            accrual_start_date=accrual_start_date,
+            value_date=value_date,
+        )
+        sell = dataclasses.replace(
+            buy,
+            pv_dirty=-buy.pv_dirty,
+            pv_clean=-buy.pv_clean,
+            cs01=-buy.cs01,
+            dv01=-buy.dv01,
+            pvbp={tenor: -v for tenor, v in buy.pvbp.items()},
+        )
+        return buy, sell
+
+    def _price_cds(
+        self,
+        maturity_date: Date,
+        par_spread: float,
+        coupon_rate: float,
+        notional: float,
+        recovery_rate: float,
+        is_buy_protection: bool,
+        accrual_start_date: Date,
+        value_date: Date,
+    ) -> CDSPricingResult:
+        """Price a single CDS once all dates have been resolved."""
         # Build credit curve using ISDA methodology
         # This creates a single-point curve bootstrapped to match the par spread
         credit_curve = bootstrap_credit_curve_isda(
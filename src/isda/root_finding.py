@@ -2,14 +2,48 @@
 Root finding algorithms for curve bootstrapping.
 
 Implements Brent's method which combines bisection with inverse quadratic
-interpolation for fast convergence.
+interpolation for fast convergence. brent and brenth delegate to SciPy's
+compiled solvers; pure_brent keeps a plain Python implementation.
 """
 
 from collections.abc import Callable
 
+from scipy.optimize import brenth as _scipy_brenth
+from scipy.optimize import brentq as _scipy_brentq
+
+from ._njit import is_jitted, njit
 from .exceptions import ConvergenceError
 
 
+def _scipy_bracketed(
+    solver: Callable,
+    f: Callable[[float], float],
+    a: float,
+    b: float,
+    tol: float,
+    max_iter: int,
+) -> float:
+    """Run a SciPy bracketing solver, raising ConvergenceError on failure."""
+    fa = f(a)
+    fb = f(b)
+
+    # Also rejects NaN values, which scipy would report as a ValueError
+    if not fa * fb <= 0:
+        raise ConvergenceError(
+            f'Function values at bounds must have opposite signs: '
+            f'f({a})={fa}, f({b})={fb}'
+        )
+
+    root, result = solver(
+        f, a, b, xtol=tol, maxiter=max_iter, full_output=True, disp=False
+    )
+    if not result.converged:
+        raise ConvergenceError(
+            f'{result.flag} after {result.iterations} iterations'
+        )
+    return float(root)
+
+
 def brent(
     f: Callable[[float], float],
     a: float,
@@ -18,7 +52,7 @@ def brent(
     max_iter: int = 100,
 ) -> float:
     """
-    Find a root of f using Brent's method.
+    Find a root of f using Brent's method (scipy.optimize.brentq).
 
     Brent's method combines bisection, secant method, and inverse quadratic
     interpolation for guaranteed convergence with superlinear speed.
@@ -27,7 +61,65 @@ def brent(
         f: Function to find root of
         a: Lower bound of search interval (f(a) and f(b) must have opposite signs)
         b: Upper bound of search interval
-        tol: Tolerance for convergence
+        tol: Absolute tolerance on the root
+        max_iter: Maximum number of iterations
+
+    Returns
+        x such that f(x) ≈ 0
+
+    Raises
+        ConvergenceError: If f(a) and f(b) have the same sign, or max_iter exceeded
+    """
+    return _scipy_bracketed(_scipy_brentq, f, a, b, tol, max_iter)
+
+
+def brenth(
+    f: Callable[[float], float],
+    a: float,
+    b: float,
+    tol: float = 1e-12,
+    max_iter: int = 100,
+) -> float:
+    """
+    Find a root of f using Brent's method with hyperbolic extrapolation.
+
+    Uses scipy.optimize.brenth, which often needs fewer function
+    evaluations than brentq on smooth functions.
+
+    Args:
+        f: Function to find root of
+        a: Lower bound of search interval (f(a) and f(b) must have opposite signs)
+        b: Upper bound of search interval
+        tol: Absolute tolerance on the root
+        max_iter: Maximum number of iterations
+
+    Returns
+        x such that f(x) ≈ 0
+
+    Raises
+        ConvergenceError: If f(a) and f(b) have the same sign, or max_iter exceeded
+    """
+    return _scipy_bracketed(_scipy_brenth, f, a, b, tol, max_iter)
+
+
+def pure_brent(
+    f: Callable[[float], float],
+    a: float,
+    b: float,
+    tol: float = 1e-12,
+    max_iter: int = 100,
+) -> float:
+    """
+    Find a root of f using a plain Python implementation of Brent's method.
+
+    Brent's method combines bisection, secant method, and inverse quadratic
+    interpolation for guaranteed convergence with superlinear speed.
+
+    Args:
+        f: Function to find root of
+        a: Lower bound of search interval (f(a) and f(b) must have opposite signs)
+        b: Upper bound of search interval
+        tol: Tolerance for convergence (on both |f(x)| and the interval)
         max_iter: Maximum number of iterations
 
     Returns
@@ -105,6 +197,83 @@ def brent(
     raise ConvergenceError(f"Brent's method did not converge in {max_iter} iterations")
 
 
+# Status codes returned by the iteration cores
+_CONVERGED = 0
+_DEGENERATE = 1  # derivative or secant slope too small
+_MAX_ITER = 2
+_NO_BRACKET = 3
+
+
+def _newton_core(f, df, x0, tol, max_iter):
+    """Newton-Raphson iteration returning (x, status) instead of raising."""
+    x = x0
+
+    for _ in range(max_iter):
+        fx = f(x)
+        if abs(fx) < tol:
+            return x, _CONVERGED
+
+        dfx = df(x)
+        if abs(dfx) < 1e-14:
+            return x, _DEGENERATE
+
+        x -= fx / dfx
+
+    return x, _MAX_ITER
+
+
+def _secant_core(f, x0, x1, tol, max_iter):
+    """Secant iteration returning (x, status) instead of raising."""
+    f0 = f(x0)
+    f1 = f(x1)
+
+    for _ in range(max_iter):
+        if abs(f1) < tol:
+            return x1, _CONVERGED
+
+        if abs(f1 - f0) < 1e-14:
+            return x1, _DEGENERATE
+
+        x2 = x1 - f1 * (x1 - x0) / (f1 - f0)
+        x0, x1 = x1, x2
+        f0, f1 = f1, f(x2)
+
+    return x1, _MAX_ITER
+
+
+def _bisection_core(f, a, b, tol, max_iter):
+    """Bisection iteration returning (x, status) instead of raising."""
+    fa = f(a)
+    fb = f(b)
+
+    if fa * fb > 0:
+        return a, _NO_BRACKET
+
+    mid = a
+    for _ in range(max_iter):
+        mid = (a + b) / 2
+        fmid = f(mid)
+
+        if abs(fmid) < tol or abs(b - a) < tol:
+            return mid, _CONVERGED
+
+        if fa * fmid < 0:
+            b = mid
+            fb = fmid
+        else:
+            a = mid
+            fa = fmid
+
+    return mid, _MAX_ITER
+
+
+# Compiled cores, used when every callback is itself an njit function so
+# Numba can call it without going back through the interpreter
+_newton_core_jit = njit(_newton_core)
+_secant_core_jit = njit(_secant_core)
+_bisection_core_jit = njit(_bisection_core)
+
+
 def newton_raphson(
     f: Callable[[float], float],
     df: Callable[[float], float],
@@ -115,6 +284,8 @@ def newton_raphson(
     """
     Find a root using Newton-Raphson method.
 
+    If f and df are Numba njit functions the iteration runs compiled.
+
     Args:
         f: Function to find root of
         df: Derivative of f
@@ -125,20 +296,16 @@ def newton_raphson(
     Returns
         x such that f(x) ≈ 0
     """
-    x = x0
+    core = _newton_core_jit if is_jitted(f) and is_jitted(df) else _newton_core
+    x, status = core(f, df, float(x0), tol, max_iter)
 
-    for _ in range(max_iter):
-        fx = f(x)
-        if abs(fx) < tol:
-            return x
-
-        dfx = df(x)
-        if abs(dfx) < 1e-14:
-            raise ConvergenceError('Newton-Raphson: derivative too small')
-
-        x -= fx / dfx
-
-    raise ConvergenceError(f'Newton-Raphson did not converge in {max_iter} iterations')
+    if status == _DEGENERATE:
+        raise ConvergenceError('Newton-Raphson: derivative too small')
+    if status == _MAX_ITER:
+        raise ConvergenceError(
+            f'Newton-Raphson did not converge in {max_iter} iterations'
+        )
+    return x
 
 
 def secant(
@@ -151,6 +318,8 @@ def secant(
     """
     Find a root using the secant method.
 
+    If f is a Numba njit function the iteration runs compiled.
+
     Args:
         f: Function to find root of
         x0: First initial guess
@@ -161,21 +330,16 @@ def secant(
     Returns
         x such that f(x) ≈ 0
     """
-    f0 = f(x0)
-    f1 = f(x1)
-
-    for _ in range(max_iter):
-        if abs(f1) < tol:
-            return x1
-
-        if abs(f1 - f0) < 1e-14:
-            raise ConvergenceError('Secant method: function values too close')
-
-        x2 = x1 - f1 * (x1 - x0) / (f1 - f0)
-        x0, x1 = x1, x2
-        f0, f1 = f1, f(x2)
+    core = _secant_core_jit if is_jitted(f) else _secant_core
+    x, status = core(f, float(x0), float(x1), tol, max_iter)
 
-    raise ConvergenceError(f'Secant method did not converge in {max_iter} iterations')
+    if status == _DEGENERATE:
+        raise ConvergenceError('Secant method: function values too close')
+    if status == _MAX_ITER:
+        raise ConvergenceError(
+            f'Secant method did not converge in {max_iter} iterations'
+        )
+    return x
 
 
 def bisection(
@@ -189,6 +353,7 @@ def bisection(
     Find a root using the bisection method.
 
     Simple but guaranteed to converge if f(a) and f(b) have opposite signs.
+    If f is a Numba njit function the iteration runs compiled.
 
     Args:
         f: Function to find root of
@@ -200,30 +365,17 @@ def bisection(
     Returns
         x such that f(x) ≈ 0
     """
-    fa = f(a)
-    fb = f(b)
+    core = _bisection_core_jit if is_jitted(f) else _bisection_core
+    x, status = core(f, float(a), float(b), tol, max_iter)
 
-    if fa * fb > 0:
+    if status == _NO_BRACKET:
         raise ConvergenceError(
             f'Function values at bounds must have opposite signs: '
-            f'f({a})={fa}, f({b})={fb}'
+            f'f({a})={f(a)}, f({b})={f(b)}'
         )
-
-    for _ in range(max_iter):
-        mid = (a + b) / 2
-        fmid = f(mid)
-
-        if abs(fmid) < tol or abs(b - a) < tol:
-            return mid
-
-        if fa * fmid < 0:
-            b = mid
-            fb = fmid
-        else:
-            a = mid
-            fa = fmid
-
-    raise ConvergenceError(f'Bisection did not converge in {max_iter} iterations')
+    if status == _MAX_ITER:
+        raise ConvergenceError(f'Bisection did not converge in {max_iter} iterations')
+    return x
 
 
 def find_root(
@@ -243,13 +395,17 @@ def find_root(
         b: Upper bound
         tol: Tolerance
         max_iter: Maximum iterations
-        method: 'brent' or 'bisection'
+        method: 'brent', 'brenth', 'pure_brent' or 'bisection'
 
     Returns
         x such that f(x) ≈ 0
     """
     if method == 'brent':
         return brent(f, a, b, tol, max_iter)
+    elif method == 'brenth':
+        return brenth(f, a, b, tol, max_iter)
+    elif method == 'pure_brent':
+        return pure_brent(f, a, b, tol, max_iter)
     elif method == 'bisection':
         return bisection(f, a, b, tol, max_iter)
     else:
@@ -5,16 +5,20 @@ Generates the payment schedule for the fee (premium) leg of a CDS,
 following ISDA standard conventions.
 """
 
+import functools
 from dataclasses import dataclass
+from datetime import date
 
-from opendate import Date, Interval
+import numpy as np
+from opendate import Date, get_default_calendar
 
+from ._yearfrac import _EPOCH_ORDINAL, _ordinal_to_datetime64, year_fraction
 from .calendar import adjust_date
 from .enums import BadDayConvention, DayCountConvention, PaymentFrequency
 from .enums import StubMethod
 
 
-@dataclass
+@dataclass(frozen=True)
 class CouponPeriod:
     """
     Represents a single coupon payment period.
@@ -72,14 +76,20 @@ class CDSSchedule:
         self.bad_day = bad_day
         self.stub_method = stub_method
 
-        self._periods: list[CouponPeriod] = []
+        # Periods are stored as parallel arrays (date ordinals and year
+        # fractions); CouponPeriod objects are only built on access
+        self._accrual_start_ord = np.empty(0, dtype=np.int64)
+        self._accrual_end_ord = np.empty(0, dtype=np.int64)
+        self._payment_ord = np.empty(0, dtype=np.int64)
+        self._year_fraction = np.empty(0, dtype=np.float64)
+        self._periods: tuple[CouponPeriod, ...] | None = None
         self._generate_schedule()
 
     def _generate_schedule(self) -> None:
         """Generate the payment schedule."""
-        self._periods = []
+        self._periods = None
 
-        months_per_period = self.frequency.months
+        months_per_period = int(self.frequency)
 
         if self.stub_method in {StubMethod.FRONT_SHORT, StubMethod.FRONT_LONG}:
             # Generate backwards from maturity
@@ -92,23 +102,29 @@ class CDSSchedule:
                 self.accrual_start, self.maturity, months_per_period
             )
 
-        # Build periods from dates
-        for i in range(len(unadj_dates) - 1):
-            acc_start = unadj_dates[i]
-            acc_end = unadj_dates[i + 1]
-
-            # Adjust payment date (accrual end is the payment date)
-            pay_date = adjust_date(acc_end, self.bad_day)
+        n = len(unadj_dates) - 1
+        boundary_ord = np.fromiter(
+            (d.toordinal() for d in unadj_dates), dtype=np.int64, count=n + 1
+        )
+        self._accrual_start_ord = boundary_ord[:-1]
+        self._accrual_end_ord = boundary_ord[1:]
+
+        # Adjust payment dates (accrual end is the payment date)
+        self._payment_ord = np.fromiter(
+            (adjust_date(d, self.bad_day).toordinal() for d in unadj_dates[1:]),
+            dtype=np.int64,
+            count=n,
+        )
 
-            # Calculate year fraction
-            yf = Interval(acc_start, acc_end).yearfrac(basis=self.day_count.value)
+        # Calculate year fractions
+        self._year_fraction = np.atleast_1d(year_fraction(
+            self.period_starts, self.period_ends, self.day_count
+        ))
 
-            self._periods.append(CouponPeriod(
-                accrual_start=acc_start,
-                accrual_end=acc_end,
-                payment_date=pay_date,
-                year_fraction=yf,
-            ))
+        # Schedules from generate_cds_schedule are shared between callers
+        for values in (self._accrual_start_ord, self._accrual_end_ord,
+                       self._payment_ord, self._year_fraction):
+            values.flags.writeable = False
 
     def _generate_dates_backward(
         self, start: Date, end: Date, months: int
@@ -145,19 +161,167 @@ class CDSSchedule:
 
         return dates
 
+    def _period(self, i: int) -> CouponPeriod:
+        """Build the CouponPeriod for period i from the schedule arrays."""
+        return CouponPeriod(
+            accrual_start=Date.fromordinal(int(self._accrual_start_ord[i])),
+            accrual_end=Date.fromordinal(int(self._accrual_end_ord[i])),
+            payment_date=Date.fromordinal(int(self._payment_ord[i])),
+            year_fraction=float(self._year_fraction[i]),
+        )
+
     @property
-    def periods(self) -> list[CouponPeriod]:
-        """List of coupon periods."""
+    def periods(self) -> tuple[CouponPeriod, ...]:
+        """Coupon periods, built on first access."""
+        if self._periods is None:
+            self._periods = tuple(self._period(i) for i in range(len(self)))
         return self._periods
 
+    @property
+    def period_starts(self) -> np.ndarray:
+        """Accrual start dates of each period as datetime64[D]."""
+        return _ordinal_to_datetime64(self._accrual_start_ord)
+
+    @property
+    def period_ends(self) -> np.ndarray:
+        """Accrual end dates of each period as datetime64[D]."""
+        return _ordinal_to_datetime64(self._accrual_end_ord)
+
+    def year_fractions(self) -> np.ndarray:
+        """Accrual year fraction of each period."""
+        return self._year_fraction
+
+    def accrual_ends_as_times(
+        self,
+        value_date: Date,
+        day_count: DayCountConvention = DayCountConvention.ACT_365F,
+    ) -> np.ndarray:
+        """
+        Accrual end of each period as a time in years from value_date.
+
+        Args:
+            value_date: Date the times are measured from
+            day_count: Day count convention for the times (default: ACT/365F,
+                as used by the curves)
+
+        Returns
+            Array of times, one per period
+        """
+        return np.atleast_1d(year_fraction(value_date, self.period_ends, day_count))
+
+    def pv_premium_leg(
+        self,
+        discount_factors: np.ndarray,
+        survival_probabilities: np.ndarray,
+        coupon_rate: float,
+        notional: float = 1.0,
+    ) -> float:
+        """
+        PV of the scheduled coupons, without accrual on default.
+
+        Sums notional * coupon_rate * yf[i] * df[i] * Q[i] over the periods
+        in a single fused pass.
+
+        Args:
+            discount_factors: Discount factor at each period's payment date
+            survival_probabilities: Survival probability at each period's end
+            coupon_rate: Annual coupon rate
+            notional: Notional amount
+
+        Returns
+            Premium leg PV
+
+        Raises
+            ValueError: If an array does not have one value per period
+        """
+        df = self._per_period(discount_factors, len(self), 'discount_factors')
+        surv = self._per_period(
+            survival_probabilities, len(self), 'survival_probabilities'
+        )
+        return notional * coupon_rate * float(
+            np.einsum('i,i,i->', self._year_fraction, df, surv)
+        )
+
+    def pv_protection_leg(
+        self,
+        discount_factors: np.ndarray,
+        survival_probabilities: np.ndarray,
+        recovery_rate: float = 0.4,
+        notional: float = 1.0,
+    ) -> float:
+        """
+        PV of the protection leg discretized on the schedule's periods.
+
+        Default in period i (probability Q[i] - Q[i+1]) pays the loss
+        discounted with the period's discount factor, typically taken at
+        the period midpoint.
+
+        Args:
+            discount_factors: Discount factor for each period
+            survival_probabilities: Survival probability at the accrual start
+                of the first period and at every period end (one more value
+                than there are periods)
+            recovery_rate: Recovery rate
+            notional: Notional amount
+
+        Returns
+            Protection leg PV
+
+        Raises
+            ValueError: If the arrays do not match the number of periods
+        """
+        df = self._per_period(discount_factors, len(self), 'discount_factors')
+        surv = self._per_period(
+            survival_probabilities, len(self) + 1, 'survival_probabilities'
+        )
+        default_probabilities = surv[:-1] - surv[1:]
+        return (1.0 - recovery_rate) * notional * float(
+            np.einsum('i,i->', df, default_probabilities)
+        )
+
+    @staticmethod
+    def _per_period(values, size: int, name: str) -> np.ndarray:
+        """Check an input has the expected number of values per period."""
+        values = np.asarray(values, dtype=np.float64)
+        if values.shape != (size,):
+            raise ValueError(f'{name} must have {size} values, got {values.shape}')
+        return values
+
     def __len__(self) -> int:
-        return len(self._periods)
+        return self._year_fraction.size
 
     def __iter__(self):
-        return iter(self._periods)
+        return iter(self.periods)
 
     def __getitem__(self, idx: int) -> CouponPeriod:
-        return self._periods[idx]
+        if isinstance(idx, slice) or self._periods is not None:
+            return self.periods[idx]
+        return self._period(range(len(self))[idx])
+
+
+@functools.lru_cache(maxsize=4096)
+def _generate_cds_schedule_cached(
+    start_ord: int,
+    maturity_ord: int,
+    frequency: PaymentFrequency,
+    day_count: DayCountConvention,
+    bad_day: BadDayConvention,
+    calendar: str,
+) -> CDSSchedule:
+    """
+    Build a schedule from date ordinals, memoized on all arguments.
+
+    calendar is only part of the key: payment dates are adjusted with
+    opendate's default calendar, so a change of default must not reuse
+    schedules built under the old one.
+    """
+    return CDSSchedule(
+        accrual_start=Date.fromordinal(start_ord),
+        maturity=Date.fromordinal(maturity_ord),
+        frequency=frequency,
+        day_count=day_count,
+        bad_day=bad_day,
+    )
 
 
 def generate_cds_schedule(
@@ -171,7 +335,10 @@ def generate_cds_schedule(
     Generate a CDS payment schedule.
 
     This is the standard function for creating CDS schedules following
-    ISDA conventions.
+    ISDA conventions. Schedules are cached, so repeated calls with the
+    same terms return the same read-only CDSSchedule instance. Dates
+    that carry their own business day calendar bypass the cache, since
+    the cache only knows opendate's default calendar.
 
     Args:
         accrual_start: Start of first accrual period (Date or string)
@@ -183,43 +350,72 @@ def generate_cds_schedule(
     Returns
         CDSSchedule with all coupon periods
     """
-    return CDSSchedule(
-        accrual_start=Date.parse(accrual_start) if isinstance(accrual_start, str) else accrual_start,
-        maturity=Date.parse(maturity) if isinstance(maturity, str) else maturity,
-        frequency=frequency,
-        day_count=day_count,
-        bad_day=bad_day,
+    if isinstance(accrual_start, str):
+        accrual_start = Date.parse(accrual_start)
+    if isinstance(maturity, str):
+        maturity = Date.parse(maturity)
+    frequency = PaymentFrequency(frequency)
+
+    # Dates set to a calendar with Date.calendar(...) adjust on it rather
+    # than on the default, so build those schedules from the dates given
+    if (getattr(accrual_start, '_calendar', None) is not None
+            or getattr(maturity, '_calendar', None) is not None):
+        return CDSSchedule(
+            accrual_start=accrual_start,
+            maturity=maturity,
+            frequency=frequency,
+            day_count=day_count,
+            bad_day=bad_day,
+        )
+
+    return _generate_cds_schedule_cached(
+        accrual_start.toordinal(),
+        maturity.toordinal(),
+        frequency,
+        day_count,
+        bad_day,
+        get_default_calendar(),
     )
 
 
 def get_accrued_days(
-    value_date: Date,
+    value_date: Date | np.ndarray,
     schedule: CDSSchedule,
-) -> tuple[int, int]:
+) -> tuple[int, int] | tuple[np.ndarray, np.ndarray]:
     """
     Calculate accrued days and period days for a value date.
 
+    value_date may also be an array of dates (datetime64 or date objects);
+    all of them are located with one searchsorted over the period ends.
+
     Args:
-        value_date: The valuation date
+        value_date: The valuation date(s)
         schedule: CDS payment schedule
 
     Returns
-        Tuple of (accrued_days, period_days) for the current period
+        Tuple of (accrued_days, period_days) for the current period, as ints
+        for a single date or int64 arrays otherwise
     """
-    for period in schedule.periods:
-        if period.accrual_start <= value_date < period.accrual_end:
-            accrued_days = Interval(period.accrual_start, value_date).days
-            period_days = Interval(period.accrual_start, period.accrual_end).days
-            return accrued_days, period_days
-
-    # If value date is before first period
-    if value_date < schedule.periods[0].accrual_start:
-        return 0, 0
-
-    # If value date is after last period
-    last = schedule.periods[-1]
-    accrued_days = Interval(last.accrual_start, value_date).days
-    period_days = Interval(last.accrual_start, last.accrual_end).days
+    starts = schedule._accrual_start_ord
+    ends = schedule._accrual_end_ord
+
+    if isinstance(value_date, date):
+        v = value_date.toordinal()
+
+        # If value date is before first period
+        if v < starts[0]:
+            return 0, 0
+
+        # Current period is the first one ending after the value date; past
+        # the last period, the last period is used
+        idx = min(int(np.searchsorted(ends, v, side='right')), len(ends) - 1)
+        return int(v - starts[idx]), int(ends[idx] - starts[idx])
+
+    v = np.asarray(value_date, dtype='datetime64[D]').astype(np.int64) + _EPOCH_ORDINAL
+    idx = np.minimum(np.searchsorted(ends, v, side='right'), len(ends) - 1)
+    before = v < starts[0]
+    accrued_days = np.where(before, 0, v - starts[idx])
+    period_days = np.where(before, 0, ends[idx] - starts[idx])
     return accrued_days, period_days
 
 
@@ -241,12 +437,15 @@ def calculate_accrued_interest(
     Returns
         Accrued interest amount
     """
-    for period in schedule.periods:
-        if period.accrual_start <= value_date <= period.accrual_end:
-            # Calculate year fraction to value date
-            yf = Interval(period.accrual_start, value_date).yearfrac(
-                basis=schedule.day_count.value
-            )
-            return notional * coupon_rate * yf
-
-    return 0.0
+    starts = schedule._accrual_start_ord
+    ends = schedule._accrual_end_ord
+    v = value_date.toordinal()
+
+    # First period whose end is on or after the value date
+    idx = int(np.searchsorted(ends, v, side='left'))
+    if idx == len(ends) or v < starts[idx]:
+        return 0.0
+
+    # Calculate year fraction to value date
+    yf = year_fraction(schedule.period_starts[idx], value_date, schedule.day_count)
+    return notional * coupon_rate * yf
@@ -4,32 +4,64 @@ Tenor parsing and manipulation.
 A tenor represents a time period like "3M" (3 months), "1Y" (1 year), etc.
 """
 
-import re
+import functools
+from collections.abc import Sequence
 from dataclasses import dataclass
 
+import numpy as np
 from opendate import Date
 
 from .calendar import adjust_date
 from .enums import BadDayConvention
 
 
-@dataclass
+# Index of each tenor unit, used to dispatch without string compares
+_DAY, _WEEK, _MONTH, _YEAR = range(4)
+_UNIT_KIND = {'D': _DAY, 'W': _WEEK, 'M': _MONTH, 'Y': _YEAR}
+
+
+@dataclass(frozen=True)
 class Tenor:
     """
     Represents a time period.
 
+    Tenors are immutable (and hashable), so parsed tenors can be shared.
+    The month, day and year conversions are computed once on construction.
+
     Attributes
         value: Numeric value (e.g., 3 for "3M")
         unit: Time unit ('D', 'W', 'M', 'Y')
     """
 
+    __slots__ = ('value', 'unit', '_kind', '_months', '_days', '_years')
+
     value: int
     unit: str
 
     def __post_init__(self):
-        self.unit = self.unit.upper()
-        if self.unit not in {'D', 'W', 'M', 'Y'}:
-            raise ValueError(f'Invalid tenor unit: {self.unit}')
+        unit = self.unit.upper()
+        if unit not in _UNIT_KIND:
+            raise ValueError(f'Invalid tenor unit: {unit}')
+        object.__setattr__(self, 'unit', unit)
+
+        value = self.value
+        kind = _UNIT_KIND[unit]
+        object.__setattr__(self, '_kind', kind)
+        if kind == _DAY:
+            months, days, years = 0, value, value / 365.0
+        elif kind == _WEEK:
+            months, days, years = 0, value * 7, value * 7 / 365.0
+        elif kind == _MONTH:
+            months, days, years = value, value * 30, value / 12.0  # Approximate
+        else:
+            months, days, years = value * 12, value * 365, float(value)  # Approximate
+        object.__setattr__(self, '_months', months)
+        object.__setattr__(self, '_days', days)
+        object.__setattr__(self, '_years', years)
+
+    def __reduce__(self):
+        # Rebuild through __init__; frozen slots cannot be restored by setattr
+        return (type(self), (self.value, self.unit))
 
     def __str__(self) -> str:
         return f'{self.value}{self.unit}'
@@ -40,44 +72,17 @@ class Tenor:
     @property
     def months(self) -> int:
         """Convert tenor to approximate number of months."""
-        if self.unit == 'D':
-            return 0
-        elif self.unit == 'W':
-            return 0
-        elif self.unit == 'M':
-            return self.value
-        elif self.unit == 'Y':
-            return self.value * 12
-        else:
-            return 0
+        return self._months
 
     @property
     def days(self) -> int:
         """Convert tenor to approximate number of days."""
-        if self.unit == 'D':
-            return self.value
-        elif self.unit == 'W':
-            return self.value * 7
-        elif self.unit == 'M':
-            return self.value * 30  # Approximate
-        elif self.unit == 'Y':
-            return self.value * 365  # Approximate
-        else:
-            return 0
+        return self._days
 
     @property
     def years(self) -> float:
         """Convert tenor to approximate number of years."""
-        if self.unit == 'D':
-            return self.value / 365.0
-        elif self.unit == 'W':
-            return self.value * 7 / 365.0
-        elif self.unit == 'M':
-            return self.value / 12.0
-        elif self.unit == 'Y':
-            return float(self.value)
-        else:
-            return 0.0
+        return self._years
 
     def add_to_date(
         self,
@@ -94,17 +99,16 @@ class Tenor:
         Returns
             Resulting Date
         """
-        if self.unit == 'D':
+        kind = self._kind
+        if kind == _DAY:
             result = d.add(days=self.value) if self.value >= 0 else d.subtract(days=-self.value)
-        elif self.unit == 'W':
+        elif kind == _WEEK:
             days = self.value * 7
             result = d.add(days=days) if days >= 0 else d.subtract(days=-days)
-        elif self.unit == 'M':
+        elif kind == _MONTH:
             result = d.add(months=self.value) if self.value >= 0 else d.subtract(months=-self.value)
-        elif self.unit == 'Y':
-            result = d.add(years=self.value) if self.value >= 0 else d.subtract(years=-self.value)
         else:
-            raise ValueError(f'Invalid tenor unit: {self.unit}')
+            result = d.add(years=self.value) if self.value >= 0 else d.subtract(years=-self.value)
 
         if convention != BadDayConvention.NONE:
             result = adjust_date(result, convention)
@@ -112,6 +116,7 @@ class Tenor:
         return result
 
 
+@functools.lru_cache(maxsize=512)
 def parse_tenor(s: str) -> Tenor:
     """
     Parse a tenor string.
@@ -127,6 +132,8 @@ def parse_tenor(s: str) -> Tenor:
         - "TN" (tomorrow-next) = 2D
         - "SN" (spot-next) = 1D
 
+    Results are cached per string; the returned Tenor is immutable.
+
     Args:
         s: Tenor string
 
@@ -143,14 +150,14 @@ def parse_tenor(s: str) -> Tenor:
     if s == 'SN':  # Spot-next
         return Tenor(1, 'D')
 
-    # Standard format: number + unit
-    match = re.match(r'^(\d+)([DWMY])$', s)
-    if match:
-        value = int(match.group(1))
-        unit = match.group(2)
-        return Tenor(value, unit)
+    # Standard format: number + single unit character
+    i = 0
+    while i < len(s) and '0' <= s[i] <= '9':
+        i += 1
+    if i == 0 or i != len(s) - 1 or s[i] not in 'DWMY':
+        raise ValueError(f'Cannot parse tenor: {s}')
 
-    raise ValueError(f'Cannot parse tenor: {s}')
+    return Tenor(int(s[:i]), s[i])
 
 
 def tenor_to_date(
@@ -175,6 +182,49 @@ def tenor_to_date(
     return tenor.add_to_date(reference_date, convention)
 
 
+def tenor_to_date_batch(
+    tenors: Sequence[str | Tenor],
+    reference_date: Date,
+    convention: BadDayConvention = BadDayConvention.MODIFIED_FOLLOWING,
+) -> np.ndarray:
+    """
+    Convert many tenors to dates relative to one reference date.
+
+    Day and week tenors are added to the reference ordinal in one vector
+    operation; only month and year tenors need calendar arithmetic. Each
+    result equals tenor_to_date for the same tenor.
+
+    Args:
+        tenors: Tenor strings or Tenor objects
+        reference_date: Base date for calculation (Date object)
+        convention: Bad day convention
+
+    Returns
+        Array of date ordinals (int64, as from date.toordinal), in the order
+        of tenors
+    """
+    parsed = [parse_tenor(t) if isinstance(t, str) else t for t in tenors]
+    n = len(parsed)
+    kinds = np.fromiter((t._kind for t in parsed), dtype=np.int64, count=n)
+    days = np.fromiter((t.days for t in parsed), dtype=np.int64, count=n)
+
+    # Day and week tenors are a fixed number of days
+    ordinals = reference_date.toordinal() + days
+    for i in np.flatnonzero(kinds >= _MONTH):
+        ordinals[i] = parsed[i].add_to_date(reference_date).toordinal()
+
+    if convention != BadDayConvention.NONE:
+        # Adjust on the reference date's own calendar, if it was given one
+        calendar = getattr(reference_date, '_calendar', None)
+        for i in range(n):
+            unadjusted = Date.fromordinal(int(ordinals[i]))
+            if calendar is not None:
+                unadjusted = unadjusted.calendar(calendar)
+            ordinals[i] = adjust_date(unadjusted, convention).toordinal()
+
+    return ordinals
+
+
 def tenor_to_years(tenor: str | Tenor) -> float:
     """Convert a tenor to approximate number of years."""
     if isinstance(tenor, str):
@@ -9,8 +9,9 @@ Uses the standard ISDA methodology with flat forward interpolation.
 """
 
 import numpy as np
-from opendate import Date, Interval
+from opendate import Date
 
+from ._yearfrac import _YF, yearfrac_act365f_array
 from .curves import ZeroCurve
 from .enums import BadDayConvention, DayCountConvention, PaymentFrequency
 from .exceptions import BootstrapError
@@ -79,10 +80,7 @@ def bootstrap_zero_curve(
     curve_day_count = DayCountConvention.ACT_365F
 
     # Calculate times from base date using curve day count
-    times = np.array([
-        Interval(base_date, d).yearfrac(basis=curve_day_count.value)
-        for d in maturity_dates
-    ])
+    times = yearfrac_act365f_array(base_date, maturity_dates)
 
     # Initialize curve with placeholder rates
     curve = ZeroCurve(
@@ -105,7 +103,7 @@ def bootstrap_zero_curve(
             # Money market rate: simple rate
             # Use mm_day_count for year fraction (ACT/360 per ISDA)
             # Note: In ISDA convention, 1Y and beyond are treated as swaps
-            t_mm = Interval(base_date, mat_date).yearfrac(basis=mm_day_count.value)
+            t_mm = _YF[mm_day_count](base_date, mat_date)
             # DF = 1 / (1 + r * t)
             # Zero rate: DF = exp(-z * t_curve)
             # So z = -ln(DF) / t_curve
@@ -155,7 +153,7 @@ def _bootstrap_swap_rate(
     year_fracs = []
     prev_date = base_date
     for pay_date in payment_dates:
-        yf = Interval(prev_date, pay_date).yearfrac(basis=day_count.value)
+        yf = _YF[day_count](prev_date, pay_date)
         year_fracs.append(yf)
         prev_date = pay_date
 
@@ -167,12 +165,12 @@ def _bootstrap_swap_rate(
         # Calculate PV of fixed leg
         pv_fixed = 0.0
         for i, (pay_date, yf) in enumerate(zip(payment_dates, year_fracs)):
-            t = Interval(base_date, pay_date).yearfrac(basis=curve.day_count.value)
+            t = _YF[curve.day_count](base_date, pay_date)
             df = curve.discount_factor(t)
             pv_fixed += swap_rate * yf * df
 
         # Add notional at maturity
-        t_mat = Interval(base_date, maturity_date).yearfrac(basis=curve.day_count.value)
+        t_mat = _YF[curve.day_count](base_date, maturity_date)
         df_mat = curve.discount_factor(t_mat)
         pv_fixed += df_mat
 
@@ -250,9 +248,7 @@ def build_zero_curve_from_rates(
             mat_dates.append(tenor.add_to_date(base_date))
 
     # Calculate times
-    times = np.array([
-        Interval(base_date, d).yearfrac(basis=day_count.value) for d in mat_dates
-    ])
+    times = np.array([_YF[day_count](base_date, d) for d in mat_dates])
 
     # Convert rates to zero rates if needed
     if rate_type == 'zero':
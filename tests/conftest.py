@@ -2,18 +2,112 @@
 Shared test fixtures for CDS pricer tests.
 """
 
+import functools
 import json
 import os
 import pathlib
 import sys
 
+import numpy as np
 import pytest
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(pathlib.Path(__file__).parent, '..', 'src'))
 
+from isda import CreditCurve, Date, ZeroCurve, bootstrap_zero_curve
 
-@pytest.fixture
+
+def _frozen(values):
+    """Convert curve knots to a read-only float array."""
+    arr = np.array(values, dtype=float)
+    arr.setflags(write=False)
+    return arr
+
+
+@functools.lru_cache(maxsize=32)
+def _zero_curve(base_date, times, rates):
+    """Build (once per argument set) a zero curve."""
+    return ZeroCurve(base_date=base_date, times=_frozen(times), rates=_frozen(rates))
+
+
+@functools.lru_cache(maxsize=32)
+def _credit_curve(base_date, times, hazard_rates):
+    """Build (once per argument set) a credit curve."""
+    return CreditCurve(
+        base_date=base_date, times=_frozen(times), hazard_rates=_frozen(hazard_rates)
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Keep the fee leg tests on one pytest-xdist worker.
+
+    The curve caches above are per process, so under ``--dist=loadgroup``
+    the fee leg tests share their session curves instead of every worker
+    building its own.
+    """
+    for item in items:
+        if item.path.name == 'test_fee_leg.py':
+            item.add_marker(pytest.mark.xdist_group(name='fee_leg'))
+
+
+@pytest.fixture(scope='session')
+def make_zero_curve():
+    """
+    Factory for zero curves shared across tests.
+
+    Curves with identical inputs are built once, so tests must not modify
+    the returned curve.
+    """
+    def make(base_date, times, rates):
+        return _zero_curve(base_date, tuple(map(float, times)), tuple(map(float, rates)))
+    return make
+
+
+@pytest.fixture(scope='session')
+def make_credit_curve():
+    """
+    Factory for credit curves shared across tests.
+
+    Curves with identical inputs are built once, so tests must not modify
+    the returned curve.
+    """
+    def make(base_date, times, hazard_rates):
+        return _credit_curve(
+            base_date, tuple(map(float, times)), tuple(map(float, hazard_rates))
+        )
+    return make
+
+
+@pytest.fixture(scope='session')
+def sample_zero_curve(make_zero_curve):
+    """Sample upward-sloping zero curve based 20 Mar 2020."""
+    return make_zero_curve(
+        Date(2020, 3, 20),
+        times=[0.25, 0.5, 1.0, 2.0, 3.0, 5.0],
+        rates=[0.02, 0.022, 0.025, 0.028, 0.03, 0.032],
+    )
+
+
+@pytest.fixture(scope='session')
+def sample_credit_curve(make_credit_curve):
+    """Sample upward-sloping credit curve based 20 Mar 2020."""
+    return make_credit_curve(
+        Date(2020, 3, 20),
+        times=[0.5, 1.0, 2.0, 3.0, 5.0],
+        hazard_rates=[0.01, 0.012, 0.015, 0.017, 0.02],
+    )
+
+
+@pytest.fixture(scope='session')
+def make_flat_credit_curve(make_credit_curve):
+    """Factory for flat credit curves based 20 Mar 2020, keyed by hazard rate."""
+    def make(hazard):
+        return make_credit_curve(Date(2020, 3, 20), [1.0, 5.0], [hazard, hazard])
+    return make
+
+
+@pytest.fixture(scope='session')
 def sample_swap_rates():
     """EUR swap rates with some negative short-term rates."""
     return [
@@ -23,7 +117,7 @@ def sample_swap_rates():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def sample_swap_tenors():
     """Swap tenors matching sample_swap_rates."""
     return [
@@ -32,6 +126,16 @@ def sample_swap_tenors():
     ]
 
 
+@pytest.fixture(scope='session')
+def bootstrapped_zero_curve(sample_swap_rates, sample_swap_tenors):
+    """Zero curve bootstrapped once per session from the sample swap rates."""
+    return bootstrap_zero_curve(
+        base_date='08/01/2018',
+        swap_rates=sample_swap_rates,
+        swap_tenors=sample_swap_tenors,
+    )
+
+
 @pytest.fixture
 def sample_swap_maturity_dates():
     """Swap maturity dates matching sample_swap_rates."""
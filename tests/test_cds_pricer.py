@@ -2,12 +2,14 @@
 Tests for CDS pricing against baseline results.
 """
 
+import functools
 import json
 import os
+import pathlib
 
+import numpy as np
 import pytest
 from isda import CDSPricer
-import pathlib
 
 # Load baseline results
 BASELINE_PATH = os.path.join(
@@ -26,27 +28,30 @@ def load_baseline():
 BASELINE = load_baseline()
 
 
-class TestCDSPricer:
-    """Tests for CDSPricer class."""
+@pytest.fixture(scope='module')
+def pricer(bootstrapped_zero_curve):
+    """Create a sample pricer on the session's bootstrapped zero curve."""
+    return CDSPricer.from_zero_curve('08/01/2018', bootstrapped_zero_curve)
 
-    @pytest.fixture
-    def pricer(self):
-        """Create a sample pricer."""
-        swap_rates = [
-            -0.00369, -0.00340, -0.00329, -0.00271, -0.00219, -0.00187,
-            -0.00149, 0.000040, 0.00159, 0.00303, 0.00435, 0.00559,
-            0.00675, 0.00785, 0.00887
-        ]
-        swap_tenors = [
-            '1M', '2M', '3M', '6M', '9M', '1Y', '2Y', '3Y', '4Y',
-            '5Y', '6Y', '7Y', '8Y', '9Y', '10Y'
-        ]
-
-        return CDSPricer(
-            trade_date='08/01/2018',
-            swap_rates=swap_rates,
-            swap_tenors=swap_tenors,
+
+@pytest.fixture(scope='module')
+def upfront_for_spread(pricer):
+    """Factory for (dirty, clean, accrued) upfronts cached by spread and notional."""
+    @functools.lru_cache
+    def _upfront(par_spread, notional=1.0):
+        return pricer.compute_upfront(
+            maturity_date='20/12/2023',
+            par_spread=par_spread,
+            coupon_rate=100,
+            notional=notional,
+            recovery_rate=0.4,
+            is_buy_protection=True,
         )
+    return _upfront
+
+
+class TestCDSPricer:
+    """Tests for CDSPricer class."""
 
     def test_price_cds_basic(self, pricer):
         """Test basic CDS pricing."""
@@ -60,30 +65,45 @@ class TestCDSPricer:
         )
 
         # At par (spread = coupon), PV should be close to zero
-        assert abs(result.pv_dirty) < 0.1
+        assert result.pv_dirty == pytest.approx(0.0, abs=0.1)
 
     def test_buy_vs_sell_symmetry(self, pricer):
         """Test that buy and sell protection give opposite PVs."""
-        result_buy = pricer.price_cds(
+        result_buy, result_sell = pricer.price_cds_both_sides(
             maturity_date='20/12/2023',
             par_spread=0.02,
             coupon_rate=100,
             notional=1.0,
             recovery_rate=0.4,
-            is_buy_protection=True,
         )
 
-        result_sell = pricer.price_cds(
+        # PVs should be opposite signs
+        assert result_buy.pv_dirty * result_sell.pv_dirty < 0
+
+    def test_both_sides_matches_direct_pricing(self, pricer):
+        """Test both-sides pricing matches pricing each side directly."""
+        result_buy, result_sell = pricer.price_cds_both_sides(
             maturity_date='20/12/2023',
             par_spread=0.02,
             coupon_rate=100,
             notional=1.0,
             recovery_rate=0.4,
-            is_buy_protection=False,
         )
 
-        # PVs should be opposite signs
-        assert result_buy.pv_dirty * result_sell.pv_dirty < 0
+        for is_buy, result in ((True, result_buy), (False, result_sell)):
+            direct = pricer.price_cds(
+                maturity_date='20/12/2023',
+                par_spread=0.02,
+                coupon_rate=100,
+                notional=1.0,
+                recovery_rate=0.4,
+                is_buy_protection=is_buy,
+            )
+            assert result.pv_dirty == pytest.approx(direct.pv_dirty, rel=1e-12)
+            assert result.pv_clean == pytest.approx(direct.pv_clean, rel=1e-12)
+            assert result.cs01 == pytest.approx(direct.cs01, rel=1e-12)
+            assert result.dv01 == pytest.approx(direct.dv01, rel=1e-12)
+            assert result.accrued_interest == direct.accrued_interest
 
     def test_spread_greater_than_coupon(self, pricer):
         """Test case where spread > coupon (protection buyer benefits)."""
@@ -120,96 +140,115 @@ class TestCDSPricer:
             is_buy_protection=True,
         )
 
-        # Different recovery rates should give different prices
+        # Different recovery rates should give different (finite) prices
+        assert np.isfinite([result_40.pv_dirty, result_60.pv_dirty]).all()
         assert result_40.pv_dirty != result_60.pv_dirty
 
-
-class TestUpfrontCalculation:
-    """Tests for upfront calculation."""
-
-    @pytest.fixture
-    def pricer(self):
-        """Create a sample pricer."""
-        swap_rates = [
-            -0.00369, -0.00340, -0.00329, -0.00271, -0.00219, -0.00187,
-            -0.00149, 0.000040, 0.00159, 0.00303, 0.00435, 0.00559,
-            0.00675, 0.00785, 0.00887
-        ]
-        swap_tenors = [
-            '1M', '2M', '3M', '6M', '9M', '1Y', '2Y', '3Y', '4Y',
-            '5Y', '6Y', '7Y', '8Y', '9Y', '10Y'
-        ]
-
-        return CDSPricer(
-            trade_date='08/01/2018',
-            swap_rates=swap_rates,
-            swap_tenors=swap_tenors,
+    @pytest.mark.slow
+    def test_price_cds_batch(self, pricer):
+        """Test batch pricing matches pricing each name individually."""
+        par_spreads = [0.005, 0.02, 0.05]
+        recovery_rates = [0.4, 0.25, 0.4]
+        results = pricer.price_cds_batch(
+            maturity_date='20/12/2023',
+            par_spreads=par_spreads,
+            coupon_rate=100,
+            notional=1.0,
+            recovery_rates=recovery_rates,
         )
 
-    def test_upfront_basic(self, pricer):
-        """Test basic upfront calculation."""
-        dirty, clean, accrued = pricer.compute_upfront(
+        assert len(results) == 3
+        assert np.isfinite([r.pv_dirty for r in results]).all()
+        single = pricer.price_cds(
             maturity_date='20/12/2023',
-            par_spread=0.02,
+            par_spread=par_spreads[1],
             coupon_rate=100,
-            notional=1000000,
-            recovery_rate=0.4,
-            is_buy_protection=True,
+            notional=1.0,
+            recovery_rate=recovery_rates[1],
+        )
+        assert results[1] == single
+
+    def test_price_cds_batch_length_mismatch(self, pricer):
+        """Test batch pricing rejects mismatched inputs."""
+        with pytest.raises(ValueError):
+            pricer.price_cds_batch(
+                maturity_date='20/12/2023',
+                par_spreads=[0.01, 0.02],
+                coupon_rate=100,
+                notional=1.0,
+                recovery_rates=[0.4],
+            )
+
+    def test_from_zero_curve_matches_bootstrap(self, pricer, sample_swap_rates, sample_swap_tenors):
+        """Test a pricer on a shared zero curve matches one built from rates."""
+        own = CDSPricer(
+            trade_date='08/01/2018',
+            swap_rates=sample_swap_rates,
+            swap_tenors=sample_swap_tenors,
         )
+        np.testing.assert_array_equal(own.zero_curve.times, pricer.zero_curve.times)
+        np.testing.assert_array_equal(own.zero_curve.rates, pricer.zero_curve.rates)
+
+    def test_from_zero_curve_date_mismatch(self, bootstrapped_zero_curve):
+        """Test the zero curve must be based on the trade date."""
+        with pytest.raises(ValueError):
+            CDSPricer.from_zero_curve('09/01/2018', bootstrapped_zero_curve)
 
-        # Should have some non-zero values
+
+class TestUpfrontCalculation:
+    """Tests for upfront calculation."""
+
+    def test_upfront_basic(self, upfront_for_spread):
+        """Test basic upfront calculation."""
+        dirty, clean, accrued = upfront_for_spread(0.02, notional=1000000)
+
+        # Should have some finite, non-zero values
+        assert np.isfinite([dirty, clean, accrued]).all()
         assert dirty != 0 or clean != 0
 
 
+@pytest.mark.slow
 class TestSpreadFromUpfront:
     """Tests for spread from upfront calculation."""
 
-    @pytest.fixture
-    def pricer(self):
-        """Create a sample pricer."""
-        swap_rates = [
-            -0.00369, -0.00340, -0.00329, -0.00271, -0.00219, -0.00187,
-            -0.00149, 0.000040, 0.00159, 0.00303, 0.00435, 0.00559,
-            0.00675, 0.00785, 0.00887
-        ]
-        swap_tenors = [
-            '1M', '2M', '3M', '6M', '9M', '1Y', '2Y', '3Y', '4Y',
-            '5Y', '6Y', '7Y', '8Y', '9Y', '10Y'
-        ]
-
-        return CDSPricer(
-            trade_date='08/01/2018',
-            swap_rates=swap_rates,
-            swap_tenors=swap_tenors,
-        )
-
-    def test_round_trip(self, pricer):
+    def test_round_trip(self, pricer, upfront_for_spread):
         """Test spread -> upfront -> spread round trip."""
         original_spread = 0.025  # 250bps
 
         # Calculate upfront from spread
-        dirty, clean, accrued = pricer.compute_upfront(
+        dirty, clean, accrued = upfront_for_spread(original_spread)
+
+        # Calculate spread from upfront (using dirty upfront as fraction of notional)
+        implied_spread = pricer.compute_spread_from_upfront(
             maturity_date='20/12/2023',
-            par_spread=original_spread,
+            upfront_charge=dirty,
             coupon_rate=100,
             notional=1.0,
             recovery_rate=0.4,
             is_buy_protection=True,
+            is_clean=False,
         )
 
-        # Calculate spread from upfront (using dirty upfront as fraction of notional)
+        # Should match original spread closely
+        assert implied_spread == pytest.approx(original_spread, abs=1e-6)
+
+    def test_round_trip_clean(self, pricer, upfront_for_spread):
+        """Test spread -> clean upfront -> spread round trip."""
+        original_spread = 0.025  # 250bps
+
+        dirty, clean, accrued = upfront_for_spread(original_spread)
+
         implied_spread = pricer.compute_spread_from_upfront(
             maturity_date='20/12/2023',
-            upfront_charge=dirty,
+            upfront_charge=clean,
             coupon_rate=100,
             notional=1.0,
             recovery_rate=0.4,
             is_buy_protection=True,
-            is_clean=False,
+            is_clean=True,
         )
 
-        # Should match original spread closely
-        assert abs(implied_spread - original_spread) < 1e-6
+        assert implied_spread == pytest.approx(original_spread, abs=1e-6)
 
 
 @pytest.mark.skipif(BASELINE is None, reason='No baseline results available')
@@ -4,46 +4,18 @@ Tests for contingent leg (protection leg) calculations.
 
 import numpy as np
 import pytest
-from isda.contingent_leg import contingent_leg_pv, expected_loss
+from isda.contingent_leg import _GRID_CACHE_SIZE, _contingent_leg_loop
+from isda.contingent_leg import _integration_grid
+from isda.contingent_leg import contingent_leg_pv, contingent_leg_pv_per_unit_loss
+from isda.contingent_leg import expected_loss, expected_loss_per_unit_loss
 from isda.contingent_leg import protection_leg_pv
-from isda.curves import CreditCurve, ZeroCurve
 from opendate import Date
 
 
-@pytest.fixture
-def sample_zero_curve():
-    """Create a sample zero curve for testing."""
-    times = np.array([0.25, 0.5, 1.0, 2.0, 3.0, 5.0])
-    rates = np.array([0.02, 0.022, 0.025, 0.028, 0.03, 0.032])
-    return ZeroCurve(
-        base_date=Date(2020, 3, 20),
-        times=times,
-        rates=rates,
-    )
-
-
-@pytest.fixture
-def sample_credit_curve():
-    """Create a sample credit curve for testing."""
-    times = np.array([0.5, 1.0, 2.0, 3.0, 5.0])
-    hazard_rates = np.array([0.01, 0.012, 0.015, 0.017, 0.02])
-    return CreditCurve(
-        base_date=Date(2020, 3, 20),
-        times=times,
-        hazard_rates=hazard_rates,
-    )
-
-
-@pytest.fixture
-def flat_credit_curve():
+@pytest.fixture(scope='module')
+def flat_credit_curve(make_flat_credit_curve):
     """Create a flat credit curve for testing."""
-    times = np.array([1.0, 5.0])
-    hazard_rates = np.array([0.02, 0.02])  # Flat 2%
-    return CreditCurve(
-        base_date=Date(2020, 3, 20),
-        times=times,
-        hazard_rates=hazard_rates,
-    )
+    return make_flat_credit_curve(0.02)  # Flat 2%
 
 
 class TestContingentLegPV:
@@ -62,33 +34,28 @@ class TestContingentLegPV:
 
     def test_contingent_leg_pv_proportional_to_loss(self, sample_zero_curve, sample_credit_curve):
         """Test contingent leg PV is proportional to loss (1 - recovery)."""
-        pv_40_rr = contingent_leg_pv(
+        pv_unit = contingent_leg_pv_per_unit_loss(
             value_date=Date(2020, 3, 20),
             maturity_date=Date(2025, 3, 20),
             discount_curve=sample_zero_curve,
             credit_curve=sample_credit_curve,
-            recovery_rate=0.4,  # Loss = 60%
         )
-        pv_20_rr = contingent_leg_pv(
+        pv_40_rr = contingent_leg_pv(
             value_date=Date(2020, 3, 20),
             maturity_date=Date(2025, 3, 20),
             discount_curve=sample_zero_curve,
             credit_curve=sample_credit_curve,
-            recovery_rate=0.2,  # Loss = 80%
+            recovery_rate=0.4,  # Loss = 60%
         )
-        # PV with 20% RR should be 80/60 = 1.33x PV with 40% RR
-        ratio = pv_20_rr / pv_40_rr
-        assert abs(ratio - (0.8 / 0.6)) < 0.01
+        assert pv_40_rr == pytest.approx(0.6 * pv_unit, rel=1e-12)
 
     def test_contingent_leg_pv_proportional_to_notional(self, sample_zero_curve, sample_credit_curve):
-        """Test contingent leg PV is proportional to notional."""
-        pv_1 = contingent_leg_pv(
+        """Test contingent leg PV is notional times loss times the unit-loss PV."""
+        pv_unit = contingent_leg_pv_per_unit_loss(
             value_date=Date(2020, 3, 20),
             maturity_date=Date(2025, 3, 20),
             discount_curve=sample_zero_curve,
             credit_curve=sample_credit_curve,
-            recovery_rate=0.4,
-            notional=1.0,
         )
         pv_1m = contingent_leg_pv(
             value_date=Date(2020, 3, 20),
@@ -98,50 +65,57 @@ class TestContingentLegPV:
             recovery_rate=0.4,
             notional=1_000_000.0,
         )
-        assert abs(pv_1m / pv_1 - 1_000_000.0) < 1.0
+        assert pv_1m == pytest.approx(1_000_000.0 * 0.6 * pv_unit, rel=1e-12)
 
-    def test_contingent_leg_pv_zero_at_full_recovery(self, sample_zero_curve, sample_credit_curve):
-        """Test contingent leg PV is zero at 100% recovery."""
-        pv = contingent_leg_pv(
+    def test_contingent_leg_pv_numpy_scalar_inputs(self, sample_zero_curve, sample_credit_curve):
+        """Test NumPy scalar recovery/notional give a plain float PV."""
+        recovery = np.float32(0.4)
+        pv_np = contingent_leg_pv(
             value_date=Date(2020, 3, 20),
             maturity_date=Date(2025, 3, 20),
             discount_curve=sample_zero_curve,
             credit_curve=sample_credit_curve,
-            recovery_rate=1.0,  # Full recovery, no loss
-        )
-        assert abs(pv) < 1e-10
-
-    def test_contingent_leg_pv_increases_with_default_prob(self, sample_zero_curve):
-        """Test contingent leg PV increases with default probability."""
-        # Low hazard rate curve
-        low_hazard = CreditCurve(
-            base_date=Date(2020, 3, 20),
-            times=np.array([1.0, 5.0]),
-            hazard_rates=np.array([0.01, 0.01]),
-        )
-        # High hazard rate curve
-        high_hazard = CreditCurve(
-            base_date=Date(2020, 3, 20),
-            times=np.array([1.0, 5.0]),
-            hazard_rates=np.array([0.05, 0.05]),
+            recovery_rate=recovery,
+            notional=np.float64(1.0),
         )
-
-        pv_low = contingent_leg_pv(
+        pv_py = contingent_leg_pv(
             value_date=Date(2020, 3, 20),
             maturity_date=Date(2025, 3, 20),
             discount_curve=sample_zero_curve,
-            credit_curve=low_hazard,
-            recovery_rate=0.4,
+            credit_curve=sample_credit_curve,
+            recovery_rate=float(recovery),
+            notional=1.0,
         )
-        pv_high = contingent_leg_pv(
+        assert type(pv_np) is float
+        assert pv_np == pv_py
+
+    def test_contingent_leg_pv_zero_at_full_recovery(self, sample_zero_curve, sample_credit_curve):
+        """Test contingent leg PV is zero at 100% recovery."""
+        pv = contingent_leg_pv(
             value_date=Date(2020, 3, 20),
             maturity_date=Date(2025, 3, 20),
             discount_curve=sample_zero_curve,
-            credit_curve=high_hazard,
-            recovery_rate=0.4,
+            credit_curve=sample_credit_curve,
+            recovery_rate=1.0,  # Full recovery, no loss
         )
+        assert pv == pytest.approx(0.0, abs=1e-10)
 
-        assert pv_high > pv_low
+    def test_contingent_leg_pv_increases_with_default_prob(self, sample_zero_curve, make_flat_credit_curve):
+        """Test contingent leg PV increases with default probability."""
+        hazards = (0.01, 0.05)
+        pvs = [
+            contingent_leg_pv(
+                value_date=Date(2020, 3, 20),
+                maturity_date=Date(2025, 3, 20),
+                discount_curve=sample_zero_curve,
+                credit_curve=make_flat_credit_curve(hazard),
+                recovery_rate=0.4,
+            )
+            for hazard in hazards
+        ]
+
+        assert pvs == sorted(pvs)
+        assert pvs[0] < pvs[1]
 
     def test_contingent_leg_pv_decreases_with_maturity(self, sample_zero_curve, sample_credit_curve):
         """Test contingent leg PV for shorter maturity is smaller."""
@@ -166,14 +140,10 @@ class TestContingentLegPV:
 class TestContingentLegTaylorExpansion:
     """Tests for Taylor expansion numerical stability."""
 
-    def test_contingent_leg_pv_with_zero_rates(self, sample_credit_curve):
+    def test_contingent_leg_pv_with_zero_rates(self, sample_credit_curve, make_zero_curve):
         """Test contingent leg PV with zero interest rates."""
         # Zero rate curve to test Taylor expansion
-        zero_rate_curve = ZeroCurve(
-            base_date=Date(2020, 3, 20),
-            times=np.array([1.0, 5.0]),
-            rates=np.array([0.0, 0.0]),
-        )
+        zero_rate_curve = make_zero_curve(Date(2020, 3, 20), [1.0, 5.0], [0.0, 0.0])
 
         # Should not raise and should give reasonable result
         pv = contingent_leg_pv(
@@ -185,13 +155,9 @@ class TestContingentLegTaylorExpansion:
         )
         assert pv > 0
 
-    def test_contingent_leg_pv_with_very_small_hazard(self, sample_zero_curve):
+    def test_contingent_leg_pv_with_very_small_hazard(self, sample_zero_curve, make_flat_credit_curve):
         """Test contingent leg PV with very small hazard rates."""
-        tiny_hazard = CreditCurve(
-            base_date=Date(2020, 3, 20),
-            times=np.array([1.0, 5.0]),
-            hazard_rates=np.array([1e-10, 1e-10]),
-        )
+        tiny_hazard = make_flat_credit_curve(1e-10)
 
         # Should not raise and should give small but positive result
         pv = contingent_leg_pv(
@@ -205,6 +171,76 @@ class TestContingentLegTaylorExpansion:
         assert pv < 0.01  # Very small due to low hazard
 
 
+class TestIntegrationGrid:
+    """Tests for the cached protection leg integration grid."""
+
+    def test_grid_cached_on_credit_curve(self, sample_zero_curve, make_flat_credit_curve):
+        """Test repeated pricing reuses the grid and gives the same PV."""
+        credit_curve = make_flat_credit_curve(0.03)
+        args = (Date(2020, 3, 20), Date(2025, 3, 20), sample_zero_curve, credit_curve)
+
+        pv1 = contingent_leg_pv(*args)
+        grid = _integration_grid(*args, 100)
+        pv2 = contingent_leg_pv(*args)
+
+        assert any(g is grid for g in credit_curve._grid_cache.values())
+        assert _integration_grid(*args, 100) is grid
+        assert len(grid) == 101
+        assert not grid.flags.writeable
+        assert pv1 == pv2
+
+    def test_grid_cache_bounded(self, sample_zero_curve, make_flat_credit_curve):
+        """Test the grid cache keeps only the most recently used grids."""
+        credit_curve = make_flat_credit_curve(0.03)
+        args = (Date(2020, 3, 20), Date(2025, 3, 20), sample_zero_curve, credit_curve)
+
+        first = _integration_grid(*args, 10)
+        for num_points in range(11, 11 + _GRID_CACHE_SIZE):
+            _integration_grid(*args, num_points)
+            # Using the first grid keeps it from being evicted
+            assert _integration_grid(*args, 10) is first
+
+        assert len(credit_curve._grid_cache) == _GRID_CACHE_SIZE
+        # The 11 point grid was the least recently used
+        assert all(key[-1] != 11 for key in credit_curve._grid_cache)
+
+    def test_grid_empty_after_maturity(self, sample_zero_curve, sample_credit_curve):
+        """Test an empty grid when maturity is not after protection start."""
+        grid = _integration_grid(
+            Date(2025, 3, 20), Date(2020, 3, 20),
+            sample_zero_curve, sample_credit_curve, 100,
+        )
+        assert len(grid) == 0
+
+
+class TestContingentLegLoop:
+    """Tests for the protection leg accumulation kernel."""
+
+    def test_loop_matches_closed_form_for_flat_curves(self):
+        """Test kernel reproduces the closed-form PV for flat curves."""
+        hazard, rate, loss = 0.02, 0.03, 0.6
+        nodes = np.linspace(0.0, 5.0, 101)
+        survival = np.exp(-hazard * nodes)
+        discount = np.exp(-rate * nodes)
+
+        pv = _contingent_leg_loop(survival, discount, loss)
+
+        expected = loss * hazard / (hazard + rate) * (1.0 - np.exp(-(hazard + rate) * 5.0))
+        assert pv == pytest.approx(expected, abs=1e-12)
+
+    def test_loop_taylor_branch(self):
+        """Test kernel Taylor branch with zero rates and tiny hazard."""
+        hazard, loss = 1e-6, 0.6
+        nodes = np.linspace(0.0, 5.0, 101)
+        survival = np.exp(-hazard * nodes)
+        discount = np.ones_like(nodes)
+
+        pv = _contingent_leg_loop(survival, discount, loss)
+
+        expected = loss * (1.0 - np.exp(-hazard * 5.0))
+        assert pv == pytest.approx(expected, abs=1e-15)
+
+
 class TestProtectionLegAlias:
     """Tests for protection_leg_pv alias."""
 
@@ -242,21 +278,18 @@ class TestExpectedLoss:
 
     def test_expected_loss_proportional_to_lgd(self, sample_credit_curve):
         """Test expected loss is proportional to loss given default."""
-        el_40_rr = expected_loss(
+        el_unit = expected_loss_per_unit_loss(
             value_date=Date(2020, 3, 20),
             maturity_date=Date(2025, 3, 20),
             credit_curve=sample_credit_curve,
-            recovery_rate=0.4,
         )
-        el_20_rr = expected_loss(
+        el_40_rr = expected_loss(
             value_date=Date(2020, 3, 20),
             maturity_date=Date(2025, 3, 20),
             credit_curve=sample_credit_curve,
-            recovery_rate=0.2,
+            recovery_rate=0.4,
         )
-        # EL with 20% RR should be 80/60 = 1.33x EL with 40% RR
-        ratio = el_20_rr / el_40_rr
-        assert abs(ratio - (0.8 / 0.6)) < 0.01
+        assert el_40_rr == pytest.approx(0.6 * el_unit, rel=1e-12)
 
 
 class TestContingentLegIntegration:
@@ -275,18 +308,18 @@ class TestContingentLegIntegration:
         # Loss = 60%, so PV ~ 0.095 * 0.6 * avg_discount ~ 0.05
         assert 0.02 < pv < 0.15
 
-    def test_contingent_leg_step_function(self):
+    def test_contingent_leg_step_function(self, make_zero_curve, make_credit_curve):
         """Test contingent leg with step function integration."""
         # Create curves with multiple steps
-        zero_curve = ZeroCurve(
-            base_date=Date(2020, 3, 20),
-            times=np.array([1.0, 2.0, 3.0, 4.0, 5.0]),
-            rates=np.array([0.02, 0.025, 0.03, 0.032, 0.035]),
+        zero_curve = make_zero_curve(
+            Date(2020, 3, 20),
+            times=[1.0, 2.0, 3.0, 4.0, 5.0],
+            rates=[0.02, 0.025, 0.03, 0.032, 0.035],
         )
-        credit_curve = CreditCurve(
-            base_date=Date(2020, 3, 20),
-            times=np.array([1.0, 2.0, 3.0, 4.0, 5.0]),
-            hazard_rates=np.array([0.01, 0.015, 0.02, 0.022, 0.025]),
+        credit_curve = make_credit_curve(
+            Date(2020, 3, 20),
+            times=[1.0, 2.0, 3.0, 4.0, 5.0],
+            hazard_rates=[0.01, 0.015, 0.02, 0.022, 0.025],
         )
 
         pv = contingent_leg_pv(
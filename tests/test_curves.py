@@ -3,7 +3,9 @@ Tests for curve classes.
 """
 
 import numpy as np
+import pytest
 from isda import CreditCurve, ZeroCurve, bootstrap_zero_curve
+from isda.exceptions import CurveError
 from opendate import Date
 
 
@@ -35,10 +37,10 @@ class TestZeroCurve:
             rates=rates,
         )
 
-        # At t=1, DF = exp(-0.05 * 1) = exp(-0.05)
-        df = curve.discount_factor(1.0)
-        expected = np.exp(-0.05)
-        assert abs(df - expected) < 1e-10
+        # DF = exp(-0.05 * t)
+        dfs = curve.discount_factor(np.array([0.0, 1.0, 2.0]))
+        expected = np.array([1.0, np.exp(-0.05), np.exp(-0.10)])
+        np.testing.assert_allclose(dfs, expected, rtol=0, atol=1e-10)
 
     def test_discount_factor_zero_time(self):
         """Test discount factor at time 0 is 1."""
@@ -81,10 +83,47 @@ class TestZeroCurve:
 
         fwd = curve.forward_rate(1.0, 2.0)
         # Forward rate should be such that DF(2) = DF(1) * exp(-fwd)
-        df1 = curve.discount_factor(1.0)
-        df2 = curve.discount_factor(2.0)
+        df1, df2 = curve.discount_factor(np.array([1.0, 2.0]))
         expected_fwd = -np.log(df2 / df1)
-        assert abs(fwd - expected_fwd) < 1e-10
+        np.testing.assert_allclose(fwd, expected_fwd, rtol=0, atol=1e-10)
+
+    def test_discount_factor_array(self):
+        """Test array discount factors match the scalar calculation."""
+        times = np.array([0.5, 1.0, 2.0, 5.0])
+        rates = np.array([0.01, 0.02, 0.025, 0.03])
+
+        curve = ZeroCurve(
+            base_date=Date(2020, 1, 1),
+            times=times,
+            rates=rates,
+        )
+
+        t = np.array([-1.0, 0.0, 0.25, 0.75, 1.5, 5.0, 7.0])
+        dfs = curve.discount_factor(t)
+        assert dfs.shape == t.shape
+        assert dfs[0] == 1.0 and dfs[1] == 1.0
+        np.testing.assert_array_equal(dfs, [curve.discount_factor(x) for x in t])
+
+    def test_knots_stored_contiguous(self):
+        """Test curve knots are taken as contiguous float64 arrays."""
+        times = np.array([0.5, 0.5, 1.0, 1.0, 2.0, 2.0])[::2]
+        curve = ZeroCurve(
+            base_date=Date(2020, 1, 1),
+            times=times,
+            rates=[1, 2, 3],
+        )
+
+        assert curve.times.flags.c_contiguous
+        assert curve.rates.dtype == np.float64
+
+    @pytest.mark.parametrize(('times', 'rates'), [
+        ([2.0, 1.0], [0.05, 0.05]),
+        ([1.0, 2.0], [0.05]),
+    ])
+    def test_invalid_knots(self, times, rates):
+        """Test unsorted or mismatched knots are rejected at construction."""
+        with pytest.raises(CurveError):
+            ZeroCurve(base_date=Date(2020, 1, 1), times=times, rates=rates)
 
 
 class TestCreditCurve:
@@ -115,10 +154,10 @@ class TestCreditCurve:
             hazard_rates=hazard_rates,
         )
 
-        # At t=1, Q = exp(-0.02 * 1)
-        surv = curve.survival_probability(1.0)
-        expected = np.exp(-0.02)
-        assert abs(surv - expected) < 1e-10
+        # Q = exp(-0.02 * t)
+        surv = curve.survival_probability(np.array([0.0, 1.0, 5.0]))
+        expected = np.array([1.0, np.exp(-0.02), np.exp(-0.10)])
+        np.testing.assert_allclose(surv, expected, rtol=0, atol=1e-10)
 
     def test_survival_probability_zero_time(self):
         """Test survival probability at time 0 is 1."""
@@ -133,6 +172,22 @@ class TestCreditCurve:
 
         assert curve.survival_probability(0.0) == 1.0
 
+    def test_survival_probability_array(self):
+        """Test array survival probabilities match the scalar calculation."""
+        times = np.array([1.0, 3.0, 5.0])
+        hazard_rates = np.array([0.01, 0.012, 0.015])
+
+        curve = CreditCurve(
+            base_date=Date(2020, 1, 1),
+            times=times,
+            hazard_rates=hazard_rates,
+        )
+
+        t = np.array([0.0, 0.5, 1.0, 2.0, 4.0, 10.0])
+        surv = curve.survival_probability(t)
+        assert surv[0] == 1.0
+        np.testing.assert_array_equal(surv, [curve.survival_probability(x) for x in t])
+
     def test_default_probability(self):
         """Test default probability calculation."""
         times = np.array([1.0])
@@ -144,50 +199,52 @@ class TestCreditCurve:
             hazard_rates=hazard_rates,
         )
 
-        pd = curve.default_probability(1.0)
-        surv = curve.survival_probability(1.0)
-        assert abs(pd + surv - 1.0) < 1e-10
+        t = np.array([0.5, 1.0, 2.0])
+        pd = curve.default_probability(t)
+        surv = curve.survival_probability(t)
+        np.testing.assert_allclose(pd + surv, 1.0, rtol=0, atol=1e-10)
 
 
-class TestBootstrapZeroCurve:
-    """Tests for zero curve bootstrapping."""
+BOOTSTRAP_CASES = {
+    'simple': ([0.02, 0.025, 0.03, 0.035], ['6M', '1Y', '2Y', '3Y']),
+    'negative': ([-0.005, -0.003, 0.0, 0.005], ['3M', '6M', '1Y', '2Y']),
+}
 
-    def test_bootstrap_simple(self):
-        """Test bootstrapping a simple curve."""
-        rates = [0.02, 0.025, 0.03, 0.035]
-        tenors = ['6M', '1Y', '2Y', '3Y']
 
-        curve = bootstrap_zero_curve(
-            base_date='01/01/2020',
-            swap_rates=rates,
-            swap_tenors=tenors,
-        )
+@pytest.fixture(scope='module', params=list(BOOTSTRAP_CASES))
+def bootstrapped_curve(request):
+    """Zero curve bootstrapped once per module for each named case."""
+    rates, tenors = BOOTSTRAP_CASES[request.param]
+    return bootstrap_zero_curve(
+        base_date='01/01/2020',
+        swap_rates=rates,
+        swap_tenors=tenors,
+    )
 
-        # Curve should have 4 points
-        assert len(curve.times) == 4
 
+class TestBootstrapZeroCurve:
+    """Tests for zero curve bootstrapping."""
+
+    def test_bootstrap_points(self, bootstrapped_curve):
+        """Test each bootstrapped curve has one point per instrument, in order."""
+        # Curve should have 4 points, in increasing time order
+        assert len(bootstrapped_curve.times) == 4
+        assert np.all(np.diff(bootstrapped_curve.times) > 0)
+
+    @pytest.mark.parametrize('bootstrapped_curve', ['simple'], indirect=True)
+    def test_bootstrap_simple(self, bootstrapped_curve):
+        """Test bootstrapping a simple curve."""
         # Discount factor at short end should be close to what we expect
-        df_6m = curve.discount_factor(0.5)
+        df_6m = bootstrapped_curve.discount_factor(0.5)
         # For MM rate, DF = 1 / (1 + r * t)
         # Then zero rate is -ln(DF) / t
         expected_df = 1 / (1 + 0.02 * 0.5)
-        assert abs(df_6m - expected_df) < 0.001
+        np.testing.assert_allclose(df_6m, expected_df, rtol=0, atol=0.001)
 
-    def test_bootstrap_negative_rates(self):
+    @pytest.mark.parametrize('bootstrapped_curve', ['negative'], indirect=True)
+    def test_bootstrap_negative_rates(self, bootstrapped_curve):
         """Test bootstrapping handles negative rates."""
-        rates = [-0.005, -0.003, 0.0, 0.005]
-        tenors = ['3M', '6M', '1Y', '2Y']
-
-        curve = bootstrap_zero_curve(
-            base_date='01/01/2020',
-            swap_rates=rates,
-            swap_tenors=tenors,
-        )
-
-        # Should handle negative rates without error
-        assert len(curve.times) == 4
-
         # Discount factors should still be positive and sensible
-        df = curve.discount_factor(1.0)
+        df = bootstrapped_curve.discount_factor(1.0)
         assert df > 0
         assert df < 2  # Reasonable bound
@@ -2,7 +2,9 @@
 Tests for date utilities using opendate library.
 """
 
-from isda import DayCountConvention
+import numpy as np
+import pytest
+from isda import DayCountConvention, year_fraction
 from opendate import Date, Interval
 
 
@@ -24,36 +26,39 @@ class TestDateParse:
         assert d.day == 15
 
 
+YEAR_FRACTION_CASES = [
+    # ACT/360: 91 days
+    (Date(2020, 1, 1), Date(2020, 4, 1), DayCountConvention.ACT_360, 91 / 360),
+    # ACT/365F: 91 days
+    (Date(2020, 1, 1), Date(2020, 4, 1), DayCountConvention.ACT_365F, 91 / 365),
+    # 30/360: 3 months = 90 days
+    (Date(2020, 1, 15), Date(2020, 4, 15), DayCountConvention.THIRTY_360, 90 / 360),
+    # Full (leap) year with ACT/365F: 366 days
+    (Date(2020, 1, 1), Date(2021, 1, 1), DayCountConvention.ACT_365F, 366 / 365),
+]
+
+
 class TestYearFraction:
     """Tests for year fraction using opendate Interval."""
 
-    def test_act_360(self):
-        """Test ACT/360 day count."""
-        d1 = Date(2020, 1, 1)
-        d2 = Date(2020, 4, 1)  # 91 days
-        yf = Interval(d1, d2).yearfrac(basis=DayCountConvention.ACT_360.value)
-        assert abs(yf - 91 / 360) < 1e-10
-
-    def test_act_365f(self):
-        """Test ACT/365F day count."""
-        d1 = Date(2020, 1, 1)
-        d2 = Date(2020, 4, 1)  # 91 days
-        yf = Interval(d1, d2).yearfrac(basis=DayCountConvention.ACT_365F.value)
-        assert abs(yf - 91 / 365) < 1e-10
-
-    def test_thirty_360(self):
-        """Test 30/360 day count."""
-        d1 = Date(2020, 1, 15)
-        d2 = Date(2020, 4, 15)  # 3 months = 90 days in 30/360
-        yf = Interval(d1, d2).yearfrac(basis=DayCountConvention.THIRTY_360.value)
-        assert abs(yf - 90 / 360) < 1e-10
-
-    def test_full_year_act_365(self):
-        """Test full year with ACT/365F."""
-        d1 = Date(2020, 1, 1)
-        d2 = Date(2021, 1, 1)  # 366 days (leap year)
-        yf = Interval(d1, d2).yearfrac(basis=DayCountConvention.ACT_365F.value)
-        assert abs(yf - 366 / 365) < 1e-10
+    @pytest.mark.parametrize(('d1', 'd2', 'day_count', 'expected'), YEAR_FRACTION_CASES)
+    def test_year_fraction(self, d1, d2, day_count, expected):
+        """Test opendate and year_fraction agree with the expected fraction."""
+        yfs = [
+            Interval(d1, d2).yearfrac(basis=day_count.value),
+            year_fraction(d1, d2, day_count),
+        ]
+        np.testing.assert_allclose(yfs, expected, rtol=0, atol=1e-10)
+
+    def test_year_fraction_vectorized(self):
+        """Test all cases in a single array call."""
+        d1, d2, day_counts, expected = zip(*YEAR_FRACTION_CASES)
+        yfs = year_fraction(
+            np.array(d1, dtype='datetime64[D]'),
+            np.array(d2, dtype='datetime64[D]'),
+            day_counts,
+        )
+        np.testing.assert_allclose(yfs, expected, rtol=0, atol=1e-10)
 
 
 class TestDateArithmetic:
@@ -4,38 +4,13 @@ Tests for fee leg (premium leg) calculations.
 
 import numpy as np
 import pytest
-from isda.curves import CreditCurve, ZeroCurve
 from isda.enums import DayCountConvention, PaymentFrequency
 from isda.fee_leg import calculate_accrued_interest, fee_leg_pv, risky_annuity
 from isda.schedule import CDSSchedule
 from opendate import Date
 
 
-@pytest.fixture
-def sample_zero_curve():
-    """Create a sample zero curve for testing."""
-    times = np.array([0.25, 0.5, 1.0, 2.0, 3.0, 5.0])
-    rates = np.array([0.02, 0.022, 0.025, 0.028, 0.03, 0.032])
-    return ZeroCurve(
-        base_date=Date(2020, 3, 20),
-        times=times,
-        rates=rates,
-    )
-
-
-@pytest.fixture
-def sample_credit_curve():
-    """Create a sample credit curve for testing."""
-    times = np.array([0.5, 1.0, 2.0, 3.0, 5.0])
-    hazard_rates = np.array([0.01, 0.012, 0.015, 0.017, 0.02])
-    return CreditCurve(
-        base_date=Date(2020, 3, 20),
-        times=times,
-        hazard_rates=hazard_rates,
-    )
-
-
-@pytest.fixture
+@pytest.fixture(scope='session')
 def sample_schedule():
     """Create a sample CDS schedule."""
     return CDSSchedule(
@@ -46,58 +21,42 @@ def sample_schedule():
     )
 
 
+@pytest.fixture(scope='module')
+def baseline_pv(sample_zero_curve, sample_credit_curve, sample_schedule):
+    """Fee leg PV at 100bps coupon on unit notional."""
+    return fee_leg_pv(
+        value_date=Date(2020, 3, 20),
+        schedule=sample_schedule,
+        coupon_rate=0.01,  # 100 bps
+        discount_curve=sample_zero_curve,
+        credit_curve=sample_credit_curve,
+    )
+
+
 class TestFeeLegPV:
     """Tests for fee leg present value calculation."""
 
-    def test_fee_leg_pv_positive(self, sample_zero_curve, sample_credit_curve, sample_schedule):
+    def test_fee_leg_pv_positive(self, baseline_pv):
         """Test fee leg PV is positive."""
+        assert baseline_pv > 0
+
+    @pytest.mark.parametrize(('param', 'scale'), [
+        ('coupon_rate', 2.0),
+        ('notional', 1_000_000.0),
+    ])
+    def test_fee_leg_pv_proportional(self, sample_zero_curve, sample_credit_curve, sample_schedule,
+                                     baseline_pv, param, scale):
+        """Test fee leg PV is proportional to coupon rate and notional."""
+        kwargs = {'coupon_rate': 0.01, 'notional': 1.0}
+        kwargs[param] *= scale
         pv = fee_leg_pv(
             value_date=Date(2020, 3, 20),
             schedule=sample_schedule,
-            coupon_rate=0.01,  # 100 bps
-            discount_curve=sample_zero_curve,
-            credit_curve=sample_credit_curve,
-        )
-        assert pv > 0
-
-    def test_fee_leg_pv_proportional_to_coupon(self, sample_zero_curve, sample_credit_curve, sample_schedule):
-        """Test fee leg PV is proportional to coupon rate."""
-        pv_100bps = fee_leg_pv(
-            value_date=Date(2020, 3, 20),
-            schedule=sample_schedule,
-            coupon_rate=0.01,
-            discount_curve=sample_zero_curve,
-            credit_curve=sample_credit_curve,
-        )
-        pv_200bps = fee_leg_pv(
-            value_date=Date(2020, 3, 20),
-            schedule=sample_schedule,
-            coupon_rate=0.02,
-            discount_curve=sample_zero_curve,
-            credit_curve=sample_credit_curve,
-        )
-        # Should be approximately 2x (within numerical tolerance)
-        assert abs(pv_200bps / pv_100bps - 2.0) < 0.01
-
-    def test_fee_leg_pv_proportional_to_notional(self, sample_zero_curve, sample_credit_curve, sample_schedule):
-        """Test fee leg PV is proportional to notional."""
-        pv_1 = fee_leg_pv(
-            value_date=Date(2020, 3, 20),
-            schedule=sample_schedule,
-            coupon_rate=0.01,
-            discount_curve=sample_zero_curve,
-            credit_curve=sample_credit_curve,
-            notional=1.0,
-        )
-        pv_1m = fee_leg_pv(
-            value_date=Date(2020, 3, 20),
-            schedule=sample_schedule,
-            coupon_rate=0.01,
             discount_curve=sample_zero_curve,
             credit_curve=sample_credit_curve,
-            notional=1_000_000.0,
+            **kwargs,
         )
-        assert abs(pv_1m / pv_1 - 1_000_000.0) < 1.0
+        assert pv == pytest.approx(baseline_pv * scale, rel=1e-6)
 
 
 class TestRiskyAnnuity:
@@ -132,47 +91,45 @@ class TestAccruedInterestFeeLeg:
     """Tests for accrued interest calculation in fee leg."""
 
     def test_accrued_interest_calculation(self, sample_schedule):
-        """Test accrued interest calculation."""
-        ai = calculate_accrued_interest(
-            value_date=Date(2020, 4, 20),  # 1 month after start
-            schedule=sample_schedule,
-            coupon_rate=0.01,
-            notional=1_000_000.0,
-        )
-        # 31 days at 100 bps on 1M = 1M * 0.01 * 31/360 = ~861
-        assert 800 < ai < 900
-
-    def test_accrued_interest_at_period_start(self, sample_schedule):
-        """Test accrued interest at period start.
+        """Test accrued interest across value dates in one array call.
 
         ISDA convention: accrued is calculated to stepinDate (value_date + 1).
         So at period start (March 20), stepinDate is March 21, giving 1 day of accrued.
         """
+        value_dates = [
+            Date(2020, 4, 20),  # 1 month after start
+            Date(2020, 3, 20),  # Period start
+            Date(2020, 1, 1),  # Before schedule
+        ]
         ai = calculate_accrued_interest(
-            value_date=Date(2020, 3, 20),  # Period start
+            value_date=np.array(value_dates, dtype='datetime64[D]'),
             schedule=sample_schedule,
             coupon_rate=0.01,
             notional=1_000_000.0,
         )
-        # 1 day of accrued (stepinDate = March 21)
-        # 1/360 * 0.01 * 1,000,000 = 27.7778
-        assert abs(ai - 27.777777778) < 0.01
 
-    def test_accrued_interest_before_schedule(self):
-        """Test accrued interest before schedule start is zero."""
-        schedule = CDSSchedule(
-            accrual_start=Date(2020, 3, 20),
-            maturity=Date(2020, 9, 20),
-            frequency=PaymentFrequency.QUARTERLY,
-        )
+        # 31 days at 100 bps on 1M = 1M * 0.01 * 31/360 = ~861
+        assert 800 < ai[0] < 900
+        # 1 day of accrued (stepinDate = March 21)
+        # 1/360 * 0.01 * 1,000,000 = 27.7778; nothing before the schedule
+        np.testing.assert_allclose(ai[1:], [27.777777778, 0.0], rtol=0, atol=0.01)
 
+    def test_accrued_interest_scalar_matches_array(self, sample_schedule):
+        """Test a single value date gives the same float as the array call."""
         ai = calculate_accrued_interest(
-            value_date=Date(2020, 1, 1),  # Before schedule
-            schedule=schedule,
+            value_date=Date(2020, 4, 20),
+            schedule=sample_schedule,
             coupon_rate=0.01,
             notional=1_000_000.0,
         )
-        assert ai == 0.0
+        batch = calculate_accrued_interest(
+            value_date=np.array(['2020-04-20'], dtype='datetime64[D]'),
+            schedule=sample_schedule,
+            coupon_rate=0.01,
+            notional=1_000_000.0,
+        )
+        assert isinstance(ai, float)
+        assert ai == batch[0]
 
 
 class TestFeeLegIntegration:
@@ -199,7 +156,7 @@ class TestFeeLegIntegration:
         # Should be less than full notional
         assert pv < 1.0
 
-    def test_fee_leg_higher_hazard_rate(self, sample_zero_curve):
+    def test_fee_leg_higher_hazard_rate(self, sample_zero_curve, make_credit_curve):
         """Test fee leg PV decreases with higher hazard rate."""
         schedule = CDSSchedule(
             accrual_start=Date(2020, 3, 20),
@@ -208,18 +165,10 @@ class TestFeeLegIntegration:
         )
 
         # Low hazard rate curve
-        low_hazard = CreditCurve(
-            base_date=Date(2020, 3, 20),
-            times=np.array([1.0, 5.0]),
-            hazard_rates=np.array([0.01, 0.01]),
-        )
+        low_hazard = make_credit_curve(Date(2020, 3, 20), [1.0, 5.0], [0.01, 0.01])
 
         # High hazard rate curve
-        high_hazard = CreditCurve(
-            base_date=Date(2020, 3, 20),
-            times=np.array([1.0, 5.0]),
-            hazard_rates=np.array([0.10, 0.10]),
-        )
+        high_hazard = make_credit_curve(Date(2020, 3, 20), [1.0, 5.0], [0.10, 0.10])
 
         pv_low = fee_leg_pv(
             value_date=Date(2020, 3, 20),
@@ -2,86 +2,65 @@
 Tests for IMM date generation.
 """
 
+import numpy as np
+import pytest
 from isda import imm_dates_for_tenors, is_imm_date, next_imm_date
 from isda import previous_imm_date
+from isda.imm import imm_date_for_tenor
 from opendate import Date
 
+STANDARD_TENORS = (0.5, 1, 2, 3, 5, 7, 10)
+
 
 class TestIsImmDate:
     """Tests for is_imm_date function."""
 
-    def test_march_20_is_imm(self):
-        """March 20th should be an IMM date."""
-        assert is_imm_date(Date(2020, 3, 20))
-
-    def test_june_20_is_imm(self):
-        """June 20th should be an IMM date."""
-        assert is_imm_date(Date(2020, 6, 20))
-
-    def test_september_20_is_imm(self):
-        """September 20th should be an IMM date."""
-        assert is_imm_date(Date(2020, 9, 20))
-
-    def test_december_20_is_imm(self):
-        """December 20th should be an IMM date."""
-        assert is_imm_date(Date(2020, 12, 20))
-
-    def test_january_20_not_imm(self):
-        """January 20th is not an IMM date."""
-        assert not is_imm_date(Date(2020, 1, 20))
-
-    def test_march_15_not_imm(self):
-        """March 15th is not an IMM date (wrong day)."""
-        assert not is_imm_date(Date(2020, 3, 15))
+    @pytest.mark.parametrize(('d', 'expected'), [
+        (Date(2020, 3, 20), True),    # March 20th
+        (Date(2020, 6, 20), True),    # June 20th
+        (Date(2020, 9, 20), True),    # September 20th
+        (Date(2020, 12, 20), True),   # December 20th
+        (Date(2020, 1, 20), False),   # Not an IMM month
+        (Date(2020, 3, 15), False),   # IMM month, wrong day
+    ])
+    def test_is_imm(self, d, expected):
+        """IMM dates are the 20th of March, June, September and December."""
+        assert is_imm_date(d) == expected
+
+
+# Next IMM date after each input (semi-annual roll: March/September roll on
+# to June/December)
+NEXT_IMM_GOLDEN = {
+    Date(2020, 1, 15): Date(2020, 6, 20),
+    Date(2020, 3, 19): Date(2020, 6, 20),
+    Date(2020, 3, 20): Date(2020, 6, 20),
+    Date(2020, 6, 21): Date(2020, 12, 20),
+}
+
+# Previous IMM date strictly before each input
+PREVIOUS_IMM_GOLDEN = {
+    Date(2020, 4, 15): Date(2020, 3, 20),
+    Date(2020, 3, 21): Date(2020, 3, 20),
+    Date(2020, 3, 20): Date(2019, 12, 20),
+}
 
 
 class TestNextImmDate:
     """Tests for next_imm_date function."""
 
-    def test_next_imm_from_january(self):
-        """Next IMM from January should be March or June (with semi-annual roll)."""
-        imm = next_imm_date(Date(2020, 1, 15))
-        # With semi-annual roll (post-2015), March rolls to June
-        assert imm.month in {3, 6}
-        assert imm.day == 20
-
-    def test_next_imm_from_march_19(self):
-        """Next IMM from March 19 should be next IMM."""
-        imm = next_imm_date(Date(2020, 3, 19))
-        # With semi-annual roll, March 20 rolls to June 20
-        assert imm == Date(2020, 6, 20)
-
-    def test_next_imm_from_march_20(self):
-        """Next IMM from March 20 should go to next IMM."""
-        imm = next_imm_date(Date(2020, 3, 20), include_current=False)
-        # With semi-annual roll, next is June 20
-        assert imm == Date(2020, 6, 20)
-
-    def test_next_imm_from_june_21(self):
-        """Next IMM from June 21 should be September or December."""
-        imm = next_imm_date(Date(2020, 6, 21))
-        # With semi-annual roll, September rolls to December
-        assert imm.month == 12
-        assert imm.day == 20
+    @pytest.mark.parametrize(('d', 'expected'), NEXT_IMM_GOLDEN.items())
+    def test_next_imm(self, d, expected):
+        """Test the next IMM date against the golden table."""
+        assert next_imm_date(d) == expected
 
 
 class TestPreviousImmDate:
     """Tests for previous_imm_date function."""
 
-    def test_previous_imm_from_april(self):
-        """Previous IMM from April should be March."""
-        imm = previous_imm_date(Date(2020, 4, 15))
-        assert imm == Date(2020, 3, 20)
-
-    def test_previous_imm_from_march_21(self):
-        """Previous IMM from March 21 should be March 20."""
-        imm = previous_imm_date(Date(2020, 3, 21))
-        assert imm == Date(2020, 3, 20)
-
-    def test_previous_imm_from_march_20(self):
-        """Previous IMM from March 20 should be December of previous year."""
-        imm = previous_imm_date(Date(2020, 3, 20))
-        assert imm == Date(2019, 12, 20)
+    @pytest.mark.parametrize(('d', 'expected'), PREVIOUS_IMM_GOLDEN.items())
+    def test_previous_imm(self, d, expected):
+        """Test the previous IMM date against the golden table."""
+        assert previous_imm_date(d) == expected
 
 
 class TestImmDatesForTenors:
@@ -105,26 +84,51 @@ class TestImmDatesForTenors:
 
     def test_imm_dates_are_valid(self):
         """Test that all generated dates are valid IMM dates."""
-        tenors = [0.5, 1, 2, 3, 5, 7, 10]
         result = imm_dates_for_tenors(
             reference_date=Date(2018, 1, 8),
-            tenor_list=tenors,
+            tenor_list=STANDARD_TENORS,
             date_format='',  # Return date objects
         )
 
-        for label, imm in result:
-            assert imm.day == 20
-            assert imm.month in {6, 12}  # With semi-annual roll
+        days = np.fromiter((imm.day for _, imm in result), int)
+        months = np.fromiter((imm.month for _, imm in result), int)
+        assert np.all(days == 20)
+        assert np.all(np.isin(months, (6, 12)))  # With semi-annual roll
 
     def test_dates_are_increasing(self):
         """Test that IMM dates are in increasing order."""
-        tenors = [0.5, 1, 2, 3, 5, 7, 10]
         result = imm_dates_for_tenors(
             reference_date=Date(2018, 1, 8),
+            tenor_list=STANDARD_TENORS,
+            date_format='',
+        )
+
+        dates = np.array([r[1] for r in result], dtype='datetime64[D]')
+        assert np.all(np.diff(dates) > np.timedelta64(0, 'D'))
+
+    @pytest.mark.parametrize('reference_date', [
+        Date(2014, 12, 19),
+        Date(2015, 3, 20),
+        Date(2015, 6, 19),
+        Date(2015, 6, 20),
+        Date(2018, 1, 8),
+        Date(2020, 2, 29),
+        Date(2020, 8, 31),
+        Date(2020, 12, 21),
+    ])
+    @pytest.mark.parametrize('apply_semi_annual_roll', [True, False])
+    def test_matches_single_tenor(self, reference_date, apply_semi_annual_roll):
+        """Test batched dates match imm_date_for_tenor one tenor at a time."""
+        tenors = [0.25, 0.5, 0.75, 1, 2, 3, 5, 7, 10]
+        result = imm_dates_for_tenors(
+            reference_date=reference_date,
             tenor_list=tenors,
+            apply_semi_annual_roll=apply_semi_annual_roll,
             date_format='',
         )
 
-        dates = [r[1] for r in result]
-        for i in range(len(dates) - 1):
-            assert dates[i] < dates[i + 1]
+        expected = [
+            imm_date_for_tenor(reference_date, int(t * 12), apply_semi_annual_roll)
+            for t in tenors
+        ]
+        assert [imm for _, imm in result] == expected
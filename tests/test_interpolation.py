@@ -4,10 +4,27 @@ Tests for interpolation functions.
 
 import numpy as np
 import pytest
+from isda._njit import njit
+from isda.exceptions import InterpolationError
 from isda.interpolation import flat_forward_discount_factor
 from isda.interpolation import flat_forward_interp
 from isda.interpolation import flat_forward_survival_probability, forward_rate
-from isda.interpolation import interpolate_curve
+from isda.interpolation import _bsearch_with_guess, _linear_interp, interpolate_curve
+from isda.interpolation import interpolate_curve_monotone
+
+
+def _frozen(*values):
+    """Read-only float array shared between tests."""
+    array = np.array(values)
+    array.setflags(write=False)
+    return array
+
+
+TIMES_2 = _frozen(1.0, 2.0)
+RATES_2 = _frozen(0.02, 0.04)
+SHALLOW_RATES_2 = _frozen(0.02, 0.03)
+TIMES_3 = _frozen(1.0, 2.0, 3.0)
+RATES_3 = _frozen(0.02, 0.03, 0.04)
 
 
 class TestFlatForwardInterp:
@@ -15,8 +32,7 @@ class TestFlatForwardInterp:
 
     def test_flat_forward_at_nodes(self):
         """Test interpolation returns exact values at nodes."""
-        times = np.array([1.0, 2.0, 3.0])
-        rates = np.array([0.02, 0.03, 0.04])
+        times, rates = TIMES_3, RATES_3
 
         assert flat_forward_interp(1.0, times, rates) == 0.02
         assert flat_forward_interp(2.0, times, rates) == 0.03
@@ -24,8 +40,7 @@ class TestFlatForwardInterp:
 
     def test_flat_forward_between_nodes(self):
         """Test interpolation between nodes."""
-        times = np.array([1.0, 2.0])
-        rates = np.array([0.02, 0.04])
+        times, rates = TIMES_2, RATES_2
 
         rate = flat_forward_interp(1.5, times, rates)
         # Flat forward should give consistent discount factor
@@ -33,24 +48,21 @@ class TestFlatForwardInterp:
 
     def test_flat_forward_before_first_node(self):
         """Test interpolation before first node uses flat extrapolation."""
-        times = np.array([1.0, 2.0])
-        rates = np.array([0.02, 0.04])
+        times, rates = TIMES_2, RATES_2
 
         rate = flat_forward_interp(0.5, times, rates)
         assert rate == 0.02  # Flat extrapolation
 
     def test_flat_forward_after_last_node(self):
         """Test interpolation after last node uses flat extrapolation."""
-        times = np.array([1.0, 2.0])
-        rates = np.array([0.02, 0.04])
+        times, rates = TIMES_2, RATES_2
 
         rate = flat_forward_interp(3.0, times, rates)
         assert rate == 0.04  # Flat extrapolation
 
     def test_flat_forward_consistency(self):
         """Test flat forward interpolation gives consistent discount factors."""
-        times = np.array([1.0, 2.0])
-        rates = np.array([0.02, 0.04])
+        times, rates = TIMES_2, RATES_2
 
         # Get interpolated rate at midpoint
         t_mid = 1.5
@@ -70,24 +82,21 @@ class TestFlatForwardDiscountFactor:
 
     def test_discount_factor_at_zero(self):
         """Test discount factor at time 0 is 1."""
-        times = np.array([1.0, 2.0])
-        rates = np.array([0.02, 0.04])
+        times, rates = TIMES_2, RATES_2
 
         df = flat_forward_discount_factor(0.0, times, rates)
         assert df == 1.0
 
     def test_discount_factor_positive(self):
         """Test discount factor is positive and less than 1."""
-        times = np.array([1.0, 2.0])
-        rates = np.array([0.02, 0.04])
+        times, rates = TIMES_2, RATES_2
 
         df = flat_forward_discount_factor(1.5, times, rates)
         assert 0 < df < 1
 
     def test_discount_factor_decreasing(self):
         """Test discount factor decreases with time."""
-        times = np.array([1.0, 2.0, 3.0])
-        rates = np.array([0.02, 0.03, 0.04])
+        times, rates = TIMES_3, RATES_3
 
         df1 = flat_forward_discount_factor(1.0, times, rates)
         df2 = flat_forward_discount_factor(2.0, times, rates)
@@ -95,22 +104,42 @@ class TestFlatForwardDiscountFactor:
 
         assert df3 < df2 < df1 < 1.0
 
+    def test_discount_factor_array(self):
+        """Test array input matches the scalar discount factor."""
+        times, rates = TIMES_3, RATES_3
+        targets = np.array([-1.0, 0.0, 0.5, 1.5, 3.0, 10.0])
+
+        result = flat_forward_discount_factor(targets, times, rates)
+        expected = [flat_forward_discount_factor(t, times, rates) for t in targets]
+        np.testing.assert_allclose(result, expected, rtol=1e-15)
+
+    def test_discount_factor_fast(self):
+        """Test the lookup-table exp stays within 1e-6 relative error."""
+        times = np.array([1.0, 5.0, 10.0, 30.0])
+        rates = np.array([0.01, 0.03, 0.05, 0.12])
+        targets = np.linspace(0.0, 30.0, 3001)  # exponents reach -3.6
+
+        result = flat_forward_discount_factor(targets, times, rates, fast=True)
+        expected = flat_forward_discount_factor(targets, times, rates)
+        np.testing.assert_allclose(result, expected, rtol=1e-6, atol=0)
+        assert flat_forward_discount_factor(
+            7.5, times, rates, fast=True
+        ) == pytest.approx(flat_forward_discount_factor(7.5, times, rates), rel=1e-6)
+
 
 class TestFlatForwardSurvivalProbability:
     """Tests for survival probability calculation."""
 
     def test_survival_at_zero(self):
         """Test survival probability at time 0 is 1."""
-        times = np.array([1.0, 2.0])
-        hazard_rates = np.array([0.02, 0.03])
+        times, hazard_rates = TIMES_2, SHALLOW_RATES_2
 
         sp = flat_forward_survival_probability(0.0, times, hazard_rates)
         assert sp == 1.0
 
     def test_survival_decreasing(self):
         """Test survival probability decreases with time."""
-        times = np.array([1.0, 2.0, 3.0])
-        hazard_rates = np.array([0.02, 0.03, 0.04])
+        times, hazard_rates = TIMES_3, RATES_3
 
         sp1 = flat_forward_survival_probability(1.0, times, hazard_rates)
         sp2 = flat_forward_survival_probability(2.0, times, hazard_rates)
@@ -118,19 +147,51 @@ class TestFlatForwardSurvivalProbability:
 
         assert sp3 < sp2 < sp1 < 1.0
 
+    def test_survival_fast(self):
+        """Test the lookup-table exp stays within 1e-6 relative error."""
+        times = TIMES_3
+        hazard_rates = np.array([0.02, 0.3, 0.9])
+        targets = np.linspace(0.0, 3.0, 301)
+
+        result = flat_forward_survival_probability(
+            targets, times, hazard_rates, fast=True
+        )
+        expected = flat_forward_survival_probability(targets, times, hazard_rates)
+        np.testing.assert_allclose(result, expected, rtol=1e-6, atol=0)
+
 
 class TestInterpolateCurve:
     """Tests for curve interpolation."""
 
     def test_interpolate_multiple_points(self):
         """Test interpolating multiple points at once."""
-        times = np.array([1.0, 2.0, 3.0])
-        rates = np.array([0.02, 0.03, 0.04])
+        times, rates = TIMES_3, RATES_3
         target_times = np.array([0.5, 1.5, 2.5, 3.5])
 
         result = interpolate_curve(target_times, times, rates)
         assert len(result) == 4
 
+    def test_interpolate_matches_scalar(self):
+        """Test vectorized flat forward matches the scalar path at every point."""
+        times = np.array([0.25, 1.0, 2.0, 3.0, 5.0])
+        rates = np.array([0.015, 0.02, 0.03, 0.035, 0.04])
+        # Before, on and between knots, and past the last knot
+        target_times = np.array([0.0, 0.1, 0.25, 0.7, 1.0, 1.5, 2.0, 4.2, 5.0, 7.0])
+
+        result = interpolate_curve(target_times, times, rates)
+        expected = [flat_forward_interp(t, times, rates) for t in target_times]
+        np.testing.assert_array_equal(result, expected)
+
+    def test_interpolate_scattered_with_repeated_knot(self):
+        """Test unordered queries over a repeated knot match the scalar path."""
+        times = np.array([0.5, 1.0, 1.0, 3.0, 5.0])
+        rates = np.array([0.01, 0.02, 0.025, 0.03, 0.04])
+        target_times = np.random.default_rng(0).uniform(-1.0, 6.0, 200)
+
+        result = interpolate_curve(target_times, times, rates)
+        expected = [flat_forward_interp(t, times, rates) for t in target_times]
+        np.testing.assert_array_equal(result, expected)
+
     def test_interpolate_linear_method(self):
         """Test linear interpolation method."""
         times = np.array([1.0, 3.0])
@@ -141,14 +202,66 @@ class TestInterpolateCurve:
         # Midpoint should be 0.03 for linear
         assert abs(result[0] - 0.03) < 1e-10
 
+    def test_interpolate_linear_jitted_caller(self):
+        """Test the linear kernel runs inside jitted code like np.interp."""
+        times, rates = TIMES_3, RATES_3
+        target_times = np.array([0.5, 1.0, 1.25, 2.5, 3.0, 4.0])
+
+        @njit
+        def caller(t, knots, values):
+            return _linear_interp(t, knots, values) * 2.0
+
+        expected = np.interp(target_times, times, rates)
+        np.testing.assert_array_equal(
+            interpolate_curve(target_times, times, rates, method='linear'), expected
+        )
+        np.testing.assert_array_equal(
+            caller(target_times, times, rates), 2.0 * expected
+        )
+
+    def test_interpolate_invalid_knots(self):
+        """Test both methods reject mismatched knots and unknown methods."""
+        for method in ('flat_forward', 'linear'):
+            with pytest.raises(InterpolationError):
+                interpolate_curve(np.array([1.0]), TIMES_3, RATES_2, method=method)
+        with pytest.raises(InterpolationError):
+            interpolate_curve(np.array([1.0]), TIMES_3, RATES_3, method='cubic')
+
+
+class TestInterpolateCurveMonotone:
+    """Tests for guess-threaded interpolation over increasing targets."""
+
+    @pytest.mark.parametrize('n', [3, 40])
+    def test_matches_interpolate_curve(self, n):
+        """Test sorted and unsorted targets match interpolate_curve exactly."""
+        times = np.linspace(0.25, 10.0, n)
+        rates = np.linspace(0.01, 0.04, n) + 0.002 * np.sin(times)
+        sorted_targets = np.linspace(-0.5, 11.0, 97)
+        shuffled = np.random.default_rng(0).permutation(sorted_targets)
+
+        for targets in (sorted_targets, shuffled):
+            np.testing.assert_array_equal(
+                interpolate_curve_monotone(targets, times, rates),
+                interpolate_curve(targets, times, rates),
+            )
+
+    def test_bsearch_with_guess_matches_searchsorted(self):
+        """Test the guessed search agrees with searchsorted from any guess."""
+        times = np.linspace(0.0, 10.0, 21)
+        targets = np.concatenate([times, times + 0.1, [-1.0, 11.0]])
+
+        expected = np.searchsorted(times, targets, side='left')
+        for guess in (0, 5, 20, 21):
+            result = [_bsearch_with_guess(times, t, guess) for t in targets]
+            np.testing.assert_array_equal(result, expected)
+
 
 class TestForwardRate:
     """Tests for forward rate calculation."""
 
     def test_forward_rate_single_period(self):
         """Test forward rate calculation for single period."""
-        times = np.array([1.0, 2.0])
-        rates = np.array([0.02, 0.03])
+        times, rates = TIMES_2, SHALLOW_RATES_2
 
         fwd = forward_rate(1.0, 2.0, times, rates)
 
@@ -161,8 +274,7 @@ class TestForwardRate:
 
     def test_forward_rate_error_on_invalid_times(self):
         """Test forward rate raises error when t2 <= t1."""
-        times = np.array([1.0, 2.0])
-        rates = np.array([0.02, 0.03])
+        times, rates = TIMES_2, SHALLOW_RATES_2
 
         with pytest.raises(Exception):
             forward_rate(2.0, 1.0, times, rates)
@@ -196,3 +308,18 @@ class TestInterpolationEdgeCases:
 
         rate = flat_forward_interp(0.0, times, rates)
         assert rate == 0.02  # Flat extrapolation
+
+    def test_non_contiguous_and_list_knots(self):
+        """Test strided arrays and lists interpolate like contiguous arrays."""
+        times, rates = TIMES_3, RATES_3
+        strided_times = np.repeat(times, 2)[::2]
+        strided_rates = np.repeat(rates, 2)[::2]
+
+        expected = flat_forward_interp(1.5, times, rates)
+        assert flat_forward_interp(1.5, strided_times, strided_rates) == expected
+        assert flat_forward_interp(1.5, list(times), list(rates)) == expected
+
+    def test_empty_curve_raises(self):
+        """Test interpolation on an empty curve raises InterpolationError."""
+        with pytest.raises(InterpolationError):
+            flat_forward_interp(1.0, np.array([]), np.array([]))
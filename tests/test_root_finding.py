@@ -1,5 +1,10 @@
 """
 Tests for root finding algorithms.
+
+Plain Python callbacks exercise the interpreted iteration cores. Newton,
+secant and bisection only run compiled when the callbacks are Numba njit
+functions (see TestJittedCallbacks); that is the fast path for tight
+calibration loops.
 """
 
 import numpy as np
@@ -178,6 +183,35 @@ class TestFindRoot:
         root = find_root(f, 0, 10, method='bisection')
         assert abs(root - 2.0) < 1e-10
 
+    @pytest.mark.parametrize('method', ['brenth', 'pure_brent'])
+    def test_find_root_brent_variants(self, method):
+        """Test find_root with the hyperbolic and pure Python Brent variants."""
+        def f(x):
+            return x**2 - 4
+
+        root = find_root(f, 0, 10, method=method)
+        assert abs(root - 2.0) < 1e-10
+
+    @pytest.mark.parametrize('method', ['brent', 'brenth', 'pure_brent'])
+    def test_find_root_same_sign_error(self, method):
+        """Test every Brent variant raises ConvergenceError without a bracket."""
+        def f(x):
+            return x**2 + 1
+
+        with pytest.raises(ConvergenceError):
+            find_root(f, 0, 10, method=method)
+
+    @pytest.mark.parametrize('method', ['brent', 'brenth', 'pure_brent'])
+    def test_find_root_objective_error_propagates(self, method):
+        """Test an exception raised by f reaches the caller unchanged."""
+        def f(x):
+            if x > 1.5:
+                raise ValueError(f'objective blew up at {x}')
+            return x - 1
+
+        with pytest.raises(ValueError, match='objective blew up at 2'):
+            find_root(f, 0, 2, method=method)
+
     def test_find_root_invalid_method(self):
         """Test find_root raises error for invalid method."""
         def f(x):
@@ -187,6 +221,42 @@ class TestFindRoot:
             find_root(f, 0, 10, method='invalid')
 
 
+def _quadratic(x):
+    return x * x - 4.0
+
+
+def _quadratic_derivative(x):
+    return 2.0 * x
+
+
+@pytest.fixture(scope='module')
+def jitted_quadratic():
+    """Numba-compiled f(x) = x**2 - 4 and its derivative."""
+    numba = pytest.importorskip('numba')
+    return numba.njit(_quadratic), numba.njit(_quadratic_derivative)
+
+
+class TestJittedCallbacks:
+    """Tests for the compiled iteration cores with njit callbacks."""
+
+    def test_jitted_matches_python(self, jitted_quadratic):
+        """Test jitted callbacks give the same roots as the Python path."""
+        f, df = jitted_quadratic
+        assert newton_raphson(f, df, 5) == newton_raphson(
+            _quadratic, _quadratic_derivative, 5
+        )
+        assert secant(f, 1, 5) == secant(_quadratic, 1, 5)
+        assert bisection(f, 0, 10) == bisection(_quadratic, 0, 10)
+
+    def test_jitted_errors(self, jitted_quadratic):
+        """Test status codes from the compiled cores raise ConvergenceError."""
+        f, df = jitted_quadratic
+        with pytest.raises(ConvergenceError):
+            bisection(f, 3, 10)
+        with pytest.raises(ConvergenceError):
+            newton_raphson(f, df, 5, max_iter=1)
+
+
 class TestRootFindingEdgeCases:
     """Edge case tests for root finding."""
 
@@ -2,11 +2,25 @@
 Tests for CDS payment schedule generation.
 """
 
+import dataclasses
+
+import numpy as np
+import pytest
 from isda.enums import DayCountConvention, PaymentFrequency
 from isda.schedule import CDSSchedule, CouponPeriod
 from isda.schedule import calculate_accrued_interest, generate_cds_schedule
 from isda.schedule import get_accrued_days
-from opendate import Date
+from opendate import Date, get_default_calendar, set_default_calendar
+
+
+@pytest.fixture(scope='module')
+def quarterly_6m():
+    """Six month quarterly ACT/360 schedule from 20 March 2020, shared by the module."""
+    return CDSSchedule(
+        accrual_start=Date(2020, 3, 20),
+        maturity=Date(2020, 9, 20),
+        frequency=PaymentFrequency.QUARTERLY,
+    )
 
 
 class TestCouponPeriod:
@@ -49,40 +63,48 @@ class TestCDSSchedule:
 
         assert len(schedule.periods) == 4
 
-    def test_schedule_iteration(self):
+    def test_schedule_iteration(self, quarterly_6m):
         """Test iterating over schedule."""
-        schedule = CDSSchedule(
-            accrual_start=Date(2020, 3, 20),
-            maturity=Date(2020, 9, 20),
-            frequency=PaymentFrequency.QUARTERLY,
-        )
-
-        periods = list(schedule)
+        periods = list(quarterly_6m)
         assert len(periods) == 2
 
-    def test_schedule_indexing(self):
+    def test_schedule_indexing(self, quarterly_6m):
         """Test indexing into schedule."""
+        first = quarterly_6m[0]
+        assert first.accrual_start == Date(2020, 3, 20)
+
+    def test_schedule_arrays_match_periods(self):
+        """Test the per-period arrays agree with the CouponPeriod view."""
         schedule = CDSSchedule(
             accrual_start=Date(2020, 3, 20),
-            maturity=Date(2020, 9, 20),
+            maturity=Date(2022, 3, 20),
             frequency=PaymentFrequency.QUARTERLY,
         )
 
-        first = schedule[0]
-        assert first.accrual_start == Date(2020, 3, 20)
-
-    def test_schedule_dates_alignment(self):
-        """Test that schedule dates are properly aligned."""
-        schedule = CDSSchedule(
+        # Indexing before and after the period list is built
+        assert schedule[-1] == CDSSchedule(
             accrual_start=Date(2020, 3, 20),
-            maturity=Date(2020, 9, 20),
+            maturity=Date(2022, 3, 20),
             frequency=PaymentFrequency.QUARTERLY,
+        ).periods[-1]
+        np.testing.assert_array_equal(
+            schedule.year_fractions(), [p.year_fraction for p in schedule.periods]
+        )
+        np.testing.assert_array_equal(
+            schedule.period_ends,
+            np.array([p.accrual_end for p in schedule], dtype='datetime64[D]'),
+        )
+        np.testing.assert_array_equal(
+            schedule.accrual_ends_as_times(Date(2020, 3, 20)),
+            [(p.accrual_end - Date(2020, 3, 20)).days / 365 for p in schedule],
         )
 
+    def test_schedule_dates_alignment(self, quarterly_6m):
+        """Test that schedule dates are properly aligned."""
         # First period ends where second begins
-        assert schedule[0].accrual_end == schedule[1].accrual_start
+        assert quarterly_6m[0].accrual_end == quarterly_6m[1].accrual_start
         # Last period ends at maturity
-        assert schedule[-1].accrual_end == Date(2020, 9, 20)
+        assert quarterly_6m[-1].accrual_end == Date(2020, 9, 20)
 
     def test_schedule_year_fractions(self):
         """Test year fraction calculation."""
@@ -117,6 +139,19 @@ class TestCDSSchedule:
 
         assert len(schedule) == 3
 
+    @pytest.mark.parametrize('frequency', list(PaymentFrequency))
+    def test_schedule_frequency_step(self, frequency):
+        """Test each frequency steps its number of months per period."""
+        assert int(frequency) == frequency.months
+        schedule = CDSSchedule(
+            accrual_start=Date(2020, 3, 20),
+            maturity=Date(2021, 3, 20),
+            frequency=frequency,
+        )
+
+        assert len(schedule) == 12 // frequency.months
+        assert schedule[0].accrual_end == Date(2020, 3, 20).add(months=frequency.months)
+
     def test_schedule_stub_period(self):
         """Test schedule with stub period."""
         # Start date not aligned with frequency
@@ -154,63 +189,147 @@ class TestGenerateCDSSchedule:
 
         assert len(schedule) == 2
 
+    def test_generate_cached(self):
+        """Test repeated terms share one read-only schedule."""
+        schedule = generate_cds_schedule('20/03/2020', '20/03/2025')
+
+        assert generate_cds_schedule(Date(2020, 3, 20), '20/03/2025') is schedule
+        assert generate_cds_schedule(
+            '20/03/2020', '20/03/2025', day_count=DayCountConvention.ACT_365F
+        ) is not schedule
+        with pytest.raises(ValueError):
+            schedule.year_fractions()[0] = 0.0
+
+    def test_generate_cached_periods_immutable(self):
+        """Test a shared schedule's periods cannot be changed by a caller."""
+        schedule = generate_cds_schedule('20/03/2020', '20/03/2025')
+
+        assert generate_cds_schedule(
+            '20/03/2020', '20/03/2025', frequency=3
+        ) is schedule
+        assert isinstance(schedule.periods, tuple)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            schedule[0].year_fraction = 0.0
+
+    def test_generate_dates_with_own_calendar(self):
+        """Test dates set to a calendar adjust on it, not the default."""
+        accrual_start = Date(2019, 8, 28).calendar('NYSE')
+        maturity = Date(2020, 11, 26).calendar('NYSE')  # Thanksgiving
+
+        schedule = generate_cds_schedule(accrual_start, maturity)
+        direct = CDSSchedule(accrual_start=accrual_start, maturity=maturity)
+        assert schedule[-1].payment_date == Date(2020, 11, 27)
+        assert schedule.periods == direct.periods
+
+    def test_generate_cache_follows_default_calendar(self):
+        """Test a change of default calendar builds a new schedule."""
+        schedule = generate_cds_schedule('20/03/2020', '20/03/2025')
+        calendar = get_default_calendar()
+        set_default_calendar('NYSE')
+        try:
+            assert generate_cds_schedule('20/03/2020', '20/03/2025') is not schedule
+        finally:
+            set_default_calendar(calendar)
+        assert generate_cds_schedule('20/03/2020', '20/03/2025') is schedule
+
 
 class TestAccruedDays:
     """Tests for accrued days calculation."""
 
-    def test_get_accrued_days_mid_period(self):
+    def test_get_accrued_days_mid_period(self, quarterly_6m):
         """Test accrued days in middle of period."""
-        schedule = CDSSchedule(
-            accrual_start=Date(2020, 3, 20),
-            maturity=Date(2020, 9, 20),
-            frequency=PaymentFrequency.QUARTERLY,
-        )
-
         # Value date in middle of first period
-        accrued, total = get_accrued_days(Date(2020, 4, 20), schedule)
+        accrued, total = get_accrued_days(Date(2020, 4, 20), quarterly_6m)
         assert accrued == 31  # Mar 20 to Apr 20
         assert total > 0
 
-    def test_get_accrued_days_start_of_period(self):
+    def test_get_accrued_days_start_of_period(self, quarterly_6m):
         """Test accrued days at start of period."""
-        schedule = CDSSchedule(
-            accrual_start=Date(2020, 3, 20),
-            maturity=Date(2020, 9, 20),
-            frequency=PaymentFrequency.QUARTERLY,
-        )
-
-        accrued, total = get_accrued_days(Date(2020, 3, 20), schedule)
+        accrued, total = get_accrued_days(Date(2020, 3, 20), quarterly_6m)
         assert accrued == 0
 
-    def test_get_accrued_days_before_schedule(self):
+    def test_get_accrued_days_before_schedule(self, quarterly_6m):
         """Test accrued days before schedule start."""
-        schedule = CDSSchedule(
+        accrued, total = get_accrued_days(Date(2020, 1, 1), quarterly_6m)
+        assert accrued == 0
+        assert total == 0
+
+    def test_get_accrued_days_period_boundary(self, quarterly_6m):
+        """Test a value date on a period end starts the next period."""
+        # Jun 20 ends the first period and starts the second (Jun 20 - Sep 20)
+        assert get_accrued_days(Date(2020, 6, 20), quarterly_6m) == (0, 92)
+        # Past maturity the last period keeps accruing
+        assert get_accrued_days(Date(2020, 10, 20), quarterly_6m) == (122, 92)
+
+    def test_get_accrued_days_array(self, quarterly_6m):
+        """Test an array of value dates matches the per-date lookups."""
+        value_dates = [
+            Date(2020, 1, 1),
+            Date(2020, 3, 20),
+            Date(2020, 4, 20),
+            Date(2020, 6, 20),
+            Date(2020, 10, 20),
+        ]
+
+        accrued, total = get_accrued_days(
+            np.array(value_dates, dtype='datetime64[D]'), quarterly_6m
+        )
+        expected = [get_accrued_days(d, quarterly_6m) for d in value_dates]
+        np.testing.assert_array_equal(np.column_stack([accrued, total]), expected)
+
+
+class TestSchedulePV:
+    """Tests for the fused premium and protection leg sums."""
+
+    @pytest.fixture
+    def schedule(self):
+        """Two year quarterly schedule."""
+        return CDSSchedule(
             accrual_start=Date(2020, 3, 20),
-            maturity=Date(2020, 9, 20),
+            maturity=Date(2022, 3, 20),
             frequency=PaymentFrequency.QUARTERLY,
         )
 
-        accrued, total = get_accrued_days(Date(2020, 1, 1), schedule)
-        assert accrued == 0
-        assert total == 0
+    def test_pv_premium_leg(self, schedule):
+        """Test the premium leg sum matches a per-period loop."""
+        df = np.linspace(0.99, 0.95, len(schedule))
+        surv = np.linspace(0.995, 0.96, len(schedule))
+
+        pv = schedule.pv_premium_leg(df, surv, coupon_rate=0.01, notional=1e6)
+        expected = sum(
+            1e6 * 0.01 * p.year_fraction * d * q
+            for p, d, q in zip(schedule, df, surv)
+        )
+        assert pv == pytest.approx(expected, rel=1e-14)
+
+    def test_pv_protection_leg(self, schedule):
+        """Test the protection leg sum matches a per-period loop."""
+        df = np.linspace(0.99, 0.95, len(schedule))
+        surv = np.linspace(1.0, 0.96, len(schedule) + 1)
+
+        pv = schedule.pv_protection_leg(df, surv, recovery_rate=0.4, notional=1e6)
+        expected = sum(
+            0.6 * 1e6 * df[i] * (surv[i] - surv[i + 1]) for i in range(len(schedule))
+        )
+        assert pv == pytest.approx(expected, rel=1e-14)
+
+    def test_pv_length_mismatch(self, schedule):
+        """Test inputs must have one value per period."""
+        with pytest.raises(ValueError):
+            schedule.pv_premium_leg(np.ones(3), np.ones(len(schedule)), 0.01)
+        with pytest.raises(ValueError):
+            schedule.pv_protection_leg(np.ones(len(schedule)), np.ones(len(schedule)))
 
 
 class TestAccruedInterest:
     """Tests for accrued interest calculation."""
 
-    def test_calculate_accrued_interest(self):
+    def test_calculate_accrued_interest(self, quarterly_6m):
         """Test accrued interest calculation."""
-        schedule = CDSSchedule(
-            accrual_start=Date(2020, 3, 20),
-            maturity=Date(2020, 9, 20),
-            frequency=PaymentFrequency.QUARTERLY,
-            day_count=DayCountConvention.ACT_360,
-        )
-
         # 100 bps coupon, 1M notional
         ai = calculate_accrued_interest(
             value_date=Date(2020, 4, 20),
-            schedule=schedule,
+            schedule=quarterly_6m,
             coupon_rate=0.01,  # 100 bps
             notional=1_000_000,
         )
@@ -219,34 +338,22 @@ class TestAccruedInterest:
         # AI = 1M * 0.01 * 31/360 = ~861
         assert 800 < ai < 900
 
-    def test_calculate_accrued_interest_at_start(self):
+    def test_calculate_accrued_interest_at_start(self, quarterly_6m):
         """Test accrued interest at period start is zero."""
-        schedule = CDSSchedule(
-            accrual_start=Date(2020, 3, 20),
-            maturity=Date(2020, 9, 20),
-            frequency=PaymentFrequency.QUARTERLY,
-        )
-
         ai = calculate_accrued_interest(
             value_date=Date(2020, 3, 20),
-            schedule=schedule,
+            schedule=quarterly_6m,
             coupon_rate=0.01,
             notional=1_000_000,
         )
 
         assert ai == 0.0
 
-    def test_calculate_accrued_interest_outside_schedule(self):
+    def test_calculate_accrued_interest_outside_schedule(self, quarterly_6m):
         """Test accrued interest outside schedule is zero."""
-        schedule = CDSSchedule(
-            accrual_start=Date(2020, 3, 20),
-            maturity=Date(2020, 9, 20),
-            frequency=PaymentFrequency.QUARTERLY,
-        )
-
         ai = calculate_accrued_interest(
             value_date=Date(2019, 1, 1),
-            schedule=schedule,
+            schedule=quarterly_6m,
             coupon_rate=0.01,
             notional=1_000_000,
         )
@@ -2,8 +2,14 @@
 Tests for tenor parsing and manipulation.
 """
 
+import dataclasses
+import pickle
+
+import numpy as np
 import pytest
-from isda.tenor import Tenor, parse_tenor, tenor_to_date, tenor_to_years
+from isda.enums import BadDayConvention
+from isda.tenor import Tenor, parse_tenor, tenor_to_date, tenor_to_date_batch
+from isda.tenor import tenor_to_years
 from opendate import Date
 
 
@@ -122,6 +128,14 @@ class TestTenor:
         result = t.add_to_date(Date(2019, 1, 31))
         assert result == Date(2019, 2, 28)
 
+    def test_tenor_slots_and_pickle(self):
+        """Test tenors carry no instance dict and survive a pickle round trip."""
+        t = Tenor(18, 'M')
+        assert not hasattr(t, '__dict__')
+        restored = pickle.loads(pickle.dumps(t))
+        assert restored == t
+        assert (restored.months, restored.days, restored.years) == (18, 540, 1.5)
+
 
 class TestParseTenor:
     """Tests for tenor parsing."""
@@ -196,6 +210,19 @@ class TestParseTenor:
         with pytest.raises(ValueError):
             parse_tenor('M')
 
+    @pytest.mark.parametrize('s', ['', '3', '3MM', 'M3', '3 M', '-3M'])
+    def test_parse_malformed(self, s):
+        """Test malformed tenor strings raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_tenor(s)
+
+    def test_parse_cached(self):
+        """Test repeated parses share one immutable Tenor."""
+        t = parse_tenor('6M')
+        assert parse_tenor('6M') is t
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            t.value = 12
+
 
 class TestTenorConversion:
     """Tests for tenor conversion functions."""
@@ -221,3 +248,29 @@ class TestTenorConversion:
         t = Tenor(6, 'M')
         years = tenor_to_years(t)
         assert years == 0.5
+
+    @pytest.mark.parametrize('convention', [
+        BadDayConvention.NONE,
+        BadDayConvention.MODIFIED_FOLLOWING,
+    ])
+    def test_tenor_to_date_batch(self, convention):
+        """Test batch conversion matches tenor_to_date in input order."""
+        tenors = ['10Y', '1M', 'ON', Tenor(2, 'W'), '6M', '7D', '1Y', '3M']
+        reference = Date(2020, 1, 31)
+
+        result = tenor_to_date_batch(tenors, reference, convention)
+        expected = [tenor_to_date(t, reference, convention).toordinal() for t in tenors]
+        assert result.dtype == np.int64
+        np.testing.assert_array_equal(result, expected)
+
+    def test_tenor_to_date_batch_reference_calendar(self):
+        """Test batch adjustment uses the reference date's own calendar."""
+        reference = Date(2020, 10, 26).calendar('NYSE')
+        tenors = ['1M', '1D', '1Y']
+        convention = BadDayConvention.FOLLOWING
+
+        result = tenor_to_date_batch(tenors, reference, convention)
+        expected = [tenor_to_date(t, reference, convention).toordinal() for t in tenors]
+        np.testing.assert_array_equal(result, expected)
+        # 2020-11-26 is Thanksgiving on NYSE
+        assert result[0] == Date(2020, 11, 27).toordinal()
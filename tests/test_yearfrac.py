@@ -0,0 +1,70 @@
+"""
+Tests for direct year fraction helpers.
+"""
+
+import numpy as np
+import pytest
+from isda._yearfrac import _YF, yearfrac_30_360, yearfrac_act360
+from isda._yearfrac import year_fraction, yearfrac_act365f, yearfrac_act365f_array
+from isda.enums import DayCountConvention
+from opendate import Date, Interval
+
+DATE_PAIRS = [
+    (Date(2020, 1, 1), Date(2020, 4, 1)),
+    (Date(2020, 1, 15), Date(2020, 4, 15)),
+    (Date(2020, 1, 31), Date(2020, 3, 31)),
+    (Date(2020, 2, 29), Date(2021, 2, 28)),
+    (Date(2019, 2, 28), Date(2020, 2, 29)),
+    (Date(2020, 3, 30), Date(2020, 5, 31)),
+    (Date(2018, 1, 8), Date(2028, 1, 10)),
+    (Date(2020, 4, 1), Date(2020, 1, 1)),
+    (Date(2020, 3, 31), Date(2020, 1, 31)),
+    (Date(2020, 6, 20), Date(2020, 6, 20)),
+]
+
+
+class TestYearFractionHelpers:
+    """Tests that the helpers reproduce opendate's year fractions."""
+
+    @pytest.mark.parametrize('day_count', [
+        DayCountConvention.ACT_365F,
+        DayCountConvention.ACT_360,
+        DayCountConvention.THIRTY_360,
+    ])
+    @pytest.mark.parametrize('d1, d2', DATE_PAIRS)
+    def test_matches_opendate(self, d1, d2, day_count):
+        """Test dispatch table matches Interval.yearfrac for each basis."""
+        expected = Interval(d1, d2).yearfrac(basis=day_count.value)
+        assert _YF[day_count](d1, d2) == expected
+
+    def test_act_365_alias(self):
+        """Test ACT/365 alias dispatches to ACT/365F."""
+        assert _YF[DayCountConvention.ACT_365] is yearfrac_act365f
+
+    def test_basic_values(self):
+        """Test helpers on a simple quarter."""
+        d1 = Date(2020, 1, 1)
+        d2 = Date(2020, 4, 1)  # 91 days
+        assert yearfrac_act365f(d1, d2) == 91 / 365
+        assert yearfrac_act360(d1, d2) == 91 / 360
+        assert yearfrac_30_360(d1, d2) == 90 / 360
+
+    def test_act365f_array(self):
+        """Test vectorized ACT/365F matches the scalar helper."""
+        base = Date(2018, 1, 8)
+        dates = [Date(2018, 2, 12), Date(2019, 1, 10), Date(2028, 1, 10)]
+        result = yearfrac_act365f_array(base, dates)
+        expected = np.array([yearfrac_act365f(base, d) for d in dates])
+        np.testing.assert_array_equal(result, expected)
+
+    @pytest.mark.parametrize('day_count', [
+        DayCountConvention.ACT_365F,
+        DayCountConvention.ACT_360,
+        DayCountConvention.THIRTY_360,
+    ])
+    def test_year_fraction_array(self, day_count):
+        """Test the vectorized year_fraction matches the scalar helpers."""
+        d1, d2 = zip(*DATE_PAIRS)
+        result = year_fraction(d1, d2, day_count)
+        expected = np.array([_YF[day_count](a, b) for a, b in DATE_PAIRS])
+        np.testing.assert_array_equal(result, expected)